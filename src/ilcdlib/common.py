@@ -17,7 +17,8 @@ import abc
 import datetime
 import logging
 import re
-from typing import IO, Literal, Self, Sequence, TextIO, TypeVar, overload
+import threading
+from typing import IO, Final, Literal, Self, Sequence, TextIO, TypeVar, overload
 
 from openepd.model.declaration import BaseDeclaration
 from openepd.model.epd import EpdWithDeps
@@ -30,9 +31,29 @@ from ilcdlib.const import IlcdDatasetType
 from ilcdlib.dto import IlcdReference, OpenEpdIlcdOrg
 from ilcdlib.reference_data import get_ilcd_epd_reference_data_provider
 from ilcdlib.type import LangDef, LocalizedStr
-from ilcdlib.xml_parser import T_ET, XmlParser
-
-XmlPath = str | tuple[str, ...] | list[str]
+from ilcdlib.xml_parser import T_ET, LocalizedXPath, XmlParser, XPathLike
+
+XmlPath = XPathLike | tuple[str, ...] | list[str]
+
+DEFAULT_XML_NS: Final[dict[str, str]] = dict(
+    xml="http://www.w3.org/XML/1998/namespace",
+    common="http://lca.jrc.it/ILCD/Common",
+    contact="http://lca.jrc.it/ILCD/Contact",
+    flow="http://lca.jrc.it/ILCD/Flow",
+    process="http://lca.jrc.it/ILCD/Process",
+    source="http://lca.jrc.it/ILCD/Source",
+    ug="http://lca.jrc.it/ILCD/UnitGroup",
+    fp="http://lca.jrc.it/ILCD/FlowProperty",
+    mm="http://www.matml.org/",
+    epd2013="http://www.iai.kit.edu/EPD/2013",
+    epd2019="http://www.iai.kit.edu/EPD/2019",
+    epd2019_indata="http://www.indata.network/EPD/2019",
+)
+"""
+Namespace prefixes available in xpath expressions of ILCD readers.
+
+Note: readers may remap `epd2019` prefix per document, so it should not be used in pre-compiled expressions.
+"""
 
 
 class BaseIlcdMediumSpecificReader(metaclass=abc.ABCMeta):
@@ -127,6 +148,27 @@ class BaseIlcdMediumSpecificReader(metaclass=abc.ABCMeta):
         """Resolve URL to the PDF file associated with this EPD."""
         return None
 
+    @property
+    def xml_tree_cache(self) -> dict[tuple[str, str, str | None], T_ET.Element] | None:
+        """
+        Return the storage for XML trees already parsed from this medium.
+
+        Mediums which content doesn't change during the lifetime of the reader may return a dictionary here,
+        parsed entities will be kept in it and reused. `None` disables caching. Cached trees are shared by all readers
+        of the medium, so they must be treated as read-only.
+        """
+        return None
+
+    @property
+    def io_lock(self) -> threading.RLock:
+        """
+        Return the lock guarding reads from this medium and updates of its XML tree cache.
+
+        A medium may be shared by readers running in several threads, e.g. the reference data provider is used by all
+        documents converted concurrently. Only the access to the medium is guarded, parsing is done outside the lock.
+        """
+        return self.__dict__.setdefault("_io_lock", threading.RLock())
+
     def __enter__(self) -> Self:
         return self
 
@@ -184,22 +226,7 @@ class IlcdXmlReader:
         self.reference_data_providers: dict[str, BaseIlcdMediumSpecificReader] = {
             "epd_ref_data": get_ilcd_epd_reference_data_provider()
         }
-        self.xml_parser = XmlParser(
-            ns_map=dict(
-                xml="http://www.w3.org/XML/1998/namespace",
-                common="http://lca.jrc.it/ILCD/Common",
-                contact="http://lca.jrc.it/ILCD/Contact",
-                flow="http://lca.jrc.it/ILCD/Flow",
-                process="http://lca.jrc.it/ILCD/Process",
-                source="http://lca.jrc.it/ILCD/Source",
-                ug="http://lca.jrc.it/ILCD/UnitGroup",
-                fp="http://lca.jrc.it/ILCD/FlowProperty",
-                mm="http://www.matml.org/",
-                epd2013="http://www.iai.kit.edu/EPD/2013",
-                epd2019="http://www.iai.kit.edu/EPD/2019",
-                epd2019_indata="http://www.indata.network/EPD/2019",
-            )
-        )
+        self.xml_parser = XmlParser(ns_map=dict(DEFAULT_XML_NS))
         self.__logger = logging.Logger(__name__)
 
     def allow_uri_based_lookup(self) -> bool:
@@ -215,12 +242,37 @@ class IlcdXmlReader:
     def get_xml_for_entity(
         self, provider: BaseIlcdMediumSpecificReader, entity_type: str, entity_id: str, entity_version: str | None
     ) -> T_ET.Element | None:
-        """Attempt to fetch XML for given entity details and return it if successful."""
+        """
+        Attempt to fetch XML for given entity details and return it if successful.
+
+        The tree may be shared with other readers of the same medium, see `get_xml_tree`.
+        """
         if provider.entity_exists(entity_type, entity_id, entity_version):
-            with provider.get_entity_stream(entity_type, entity_id, entity_version) as stream:
-                return self.xml_parser.get_xml_tree(stream)
+            return self._parse_entity_xml(provider, entity_type, entity_id, entity_version)
         return None
 
+    def _parse_entity_xml(
+        self, provider: BaseIlcdMediumSpecificReader, entity_type: str, entity_id: str, entity_version: str | None
+    ) -> T_ET.Element:
+        """
+        Parse XML of the given entity, reusing the tree parsed before if the provider supports caching.
+
+        :raise: ValueError if the entity does not exist.
+        """
+        cache = provider.xml_tree_cache
+        cache_key = (entity_type, entity_id, entity_version)
+        with provider.io_lock:
+            if cache is not None and (tree := cache.get(cache_key)) is not None:
+                return tree
+            with provider.get_entity_stream(entity_type, entity_id, entity_version, binary=True) as stream:
+                content = stream.read()
+        tree = self.xml_parser.get_xml_tree(content)
+        if cache is None:
+            return tree
+        with provider.io_lock:
+            # Another thread may have parsed the same entity meanwhile, all callers get the tree cached first.
+            return cache.setdefault(cache_key, tree)
+
     def get_xml_tree(
         self,
         entity_type: str,
@@ -240,10 +292,12 @@ class IlcdXmlReader:
         :param allow_static_datasets: whether to allow to check entity in static datasets if it doesn't
                                       exist in the given one.
         :raise: ValueError if the entity does not exist.
+
+        If the medium caches parsed trees (see `BaseIlcdMediumSpecificReader.xml_tree_cache`), the same tree is
+        returned to every caller. It must not be modified, copy it (e.g. with `copy.deepcopy`) if changes are needed.
         """
         try:
-            with self.data_provider.get_entity_stream(entity_type, entity_id, entity_version) as stream:
-                return self.xml_parser.get_xml_tree(stream)
+            return self._parse_entity_xml(self.data_provider, entity_type, entity_id, entity_version)
         except ValueError:
             if allow_static_datasets:
                 uuid_from_uri = self._UUID_REGEX.search(entity_uri) if entity_uri else None
@@ -259,13 +313,11 @@ class IlcdXmlReader:
 
         raise ValueError(f"Entity {entity_id} version {entity_version} (type: {entity_type}) does not exist.")
 
-    def _preprocess_path(self, path: XmlPath) -> str:
-        """Convert XPath defined in a form of tuple or string into a string representation."""
-        if not isinstance(path, str):
-            str_path = "/".join(path)
-        else:
-            str_path = path
-        return str_path
+    def _preprocess_path(self, path: XmlPath) -> XPathLike:
+        """Convert XPath defined in a form of tuple or string into a string representation, keep compiled xpath."""
+        if isinstance(path, (tuple, list)):
+            return "/".join(path)
+        return path
 
     def _get_el(
         self, root: T_ET.Element, path: XmlPath, default_value: T_ET.Element | None = None
@@ -330,21 +382,30 @@ class IlcdXmlReader:
         return default_value
 
     def _get_localized_text(
-        self, root: T_ET.Element, path: XmlPath, lang: LangDef, default_value: LocalizedStr | None = None
+        self,
+        root: T_ET.Element,
+        path: str | tuple[str, ...] | list[str] | LocalizedXPath,
+        lang: LangDef,
+        default_value: LocalizedStr | None = None,
     ) -> LocalizedStr | None:
         """
         Get the element text for the given language.
 
         :param root: The element to get the text from.
+        :param path: The path to the element, either as string / tuple or pre-compiled with `compile_localized_xpath`.
         :param lang: The language to get the text for.
         :return: The localized text for the given language or None if not found.
         """
         if isinstance(lang, str) or lang is None:
             lang = [lang]
+        # Tag tuples are joined once per call, not once per candidate language.
+        base_xpath = None if isinstance(path, LocalizedXPath) else self._preprocess_path(path)
         for x in lang:
-            xpath = self._preprocess_path(path)
-            xpath += f"[@xml:lang='{x}']" if x is not None else "[1]"
-            el = self.xml_parser.get_el(root, xpath)
+            if base_xpath is None:
+                found = path.by_lang(root, lang=x) if x is not None else path.first(root)  # type: ignore[union-attr]
+                el = found[0] if found else None
+            else:
+                el = self.xml_parser.get_localized_el(root, base_xpath, x)  # type: ignore[arg-type]
             if el is not None:
                 res = el.text
                 if res and el.attrib and el.attrib.get(self._LANG_ATTRIB_NAME):
@@ -366,7 +427,7 @@ class IlcdXmlReader:
         :param path: The path to the reference element (xpath in a form of tuple or string).
         :param default_value: Default value to return if reference is not found.
         """
-        xpath = f"{self._preprocess_path(path)}"
+        xpath = self._preprocess_path(path)
         el = self.xml_parser.get_el(root, xpath)
         if el is None or el.attrib is None:
             return default_value
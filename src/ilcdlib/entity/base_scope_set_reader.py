@@ -24,6 +24,9 @@ from ilcdlib.entity.unit import IlcdUnitGroupReader
 from ilcdlib.mapping.common import BaseDataMapper
 from ilcdlib.xml_parser import T_ET
 
+_MODULE_NAME_REMAP: dict[str | None, str] = {"A1-A3": "A1A2A3"}
+"""ILCD module names which are spelled differently in openEPD."""
+
 
 class BaseIlcdScopeSetsReader(IlcdXmlReader):
     """Read scope sets from XML file."""
@@ -122,7 +125,7 @@ class BaseIlcdScopeSetsReader(IlcdXmlReader):
             value = float(el.text)
         except ValueError:
             return None
-        measurement = Measurement(mean=value, unit=unit_name)
+        measurement = Measurement.construct(mean=value, unit=unit_name)
 
         if scenario_name is None or scenario_name == "Standard scenario":
             if ScopeSet.is_allowed_field_name(module_name):  # type: ignore
@@ -143,9 +146,7 @@ class BaseIlcdScopeSetsReader(IlcdXmlReader):
 
     @staticmethod
     def __map_module_name(module_name: str | None) -> str | None:
-        if module_name == "A1-A3":
-            return "A1A2A3"
-        return module_name
+        return _MODULE_NAME_REMAP.get(module_name, module_name)
 
     def _extract_and_set_scope_set(
         self,
@@ -26,6 +26,19 @@ from ilcdlib.type import LangDef
 from ilcdlib.utils import create_openepd_attachments, none_throws, provider_domain_name_from_url
 from ilcdlib.xml_parser import T_ET
 
+_DATA_SET_INFO_PATH = "contact:contactInformation/contact:dataSetInformation"
+_UUID_PATH = f"{_DATA_SET_INFO_PATH}/common:UUID"
+_VERSION_PATH = "contact:administrativeInformation/contact:publicationAndOwnership/common:dataSetVersion"
+_NAME_PATH = f"{_DATA_SET_INFO_PATH}/common:name"
+_SHORT_NAME_PATH = f"{_DATA_SET_INFO_PATH}/common:shortName"
+_CONTACT_CLASS_PATH = (  # alternatively "common:classification[not(@class)]"
+    f"{_DATA_SET_INFO_PATH}/contact:classificationInformation/common:classification/common:class[@level='0']"
+)
+_PHONE_PATH = f"{_DATA_SET_INFO_PATH}/contact:telephone"
+_EMAIL_PATH = f"{_DATA_SET_INFO_PATH}/contact:email"
+_WEBSITE_PATH = f"{_DATA_SET_INFO_PATH}/contact:WWWAddress"
+_ADDRESS_PATH = f"{_DATA_SET_INFO_PATH}/contact:contactAddress"
+
 
 class IlcdContactReader(OpenEpdContactSupportReader, IlcdXmlReader):
     """Reader for ILCD contact data sets."""
@@ -40,41 +53,23 @@ class IlcdContactReader(OpenEpdContactSupportReader, IlcdXmlReader):
 
     def get_uuid(self) -> str:
         """Get the UUID of the entity described by this data set."""
-        return none_throws(
-            self._get_text(self._entity, ("contact:contactInformation", "contact:dataSetInformation", "common:UUID"))
-        )
+        return none_throws(self._get_text(self._entity, _UUID_PATH))
 
     def get_version(self) -> str | None:
         """Get the version of the entity described by this data set."""
-        return self._get_text(
-            self._entity,
-            ("contact:administrativeInformation", "contact:publicationAndOwnership", "common:dataSetVersion"),
-        )
+        return self._get_text(self._entity, _VERSION_PATH)
 
     def get_name(self, lang: LangDef) -> str | None:
         """Get the name of the entity described by this data set."""
-        return self._get_localized_text(
-            self._entity, ("contact:contactInformation", "contact:dataSetInformation", "common:name"), lang
-        )
+        return self._get_localized_text(self._entity, _NAME_PATH, lang)
 
     def get_short_name(self, lang: LangDef) -> str | None:
         """Get the short name of the entity described by this data set."""
-        return self._get_localized_text(
-            self._entity, ("contact:contactInformation", "contact:dataSetInformation", "common:shortName"), lang
-        )
+        return self._get_localized_text(self._entity, _SHORT_NAME_PATH, lang)
 
     def get_contact_class(self) -> IlcdContactClass | None:
         """Get the contact class of the contact by this data set."""
-        ilcd_contact_class = self._get_text(
-            self._entity,
-            (
-                "contact:contactInformation",
-                "contact:dataSetInformation",
-                "contact:classificationInformation",
-                "common:classification",  # "common:classification[not(@class)]",
-                "common:class[@level='0']",
-            ),
-        )
+        ilcd_contact_class = self._get_text(self._entity, _CONTACT_CLASS_PATH)
         if ilcd_contact_class is None:
             return None
         try:
@@ -84,27 +79,19 @@ class IlcdContactReader(OpenEpdContactSupportReader, IlcdXmlReader):
 
     def get_phone(self) -> str | None:
         """Get the phone number of the contact described by this data set."""
-        return self._get_text(
-            self._entity, ("contact:contactInformation", "contact:dataSetInformation", "contact:telephone")
-        )
+        return self._get_text(self._entity, _PHONE_PATH)
 
     def get_email(self) -> str | None:
         """Get the email address of the contact described by this data set."""
-        return self._get_text(
-            self._entity, ("contact:contactInformation", "contact:dataSetInformation", "contact:email")
-        )
+        return self._get_text(self._entity, _EMAIL_PATH)
 
     def get_website(self) -> str | None:
         """Get the website of the contact described by this data set."""
-        return self._get_text(
-            self._entity, ("contact:contactInformation", "contact:dataSetInformation", "contact:WWWAddress")
-        )
+        return self._get_text(self._entity, _WEBSITE_PATH)
 
     def get_address(self) -> str | None:
         """Get the address of the contact described by this data set."""
-        return self._get_text(
-            self._entity, ("contact:contactInformation", "contact:dataSetInformation", "contact:contactAddress")
-        )
+        return self._get_text(self._entity, _ADDRESS_PATH)
 
     def to_openepd_org(
         self, lang: LangDef, base_url: str | None = None, provider_domain: str | None = None
@@ -16,7 +16,7 @@
 import logging
 
 from openepd.model.common import Measurement
-from openepd.model.lcia import Impacts, ImpactSet, ScopeSet
+from openepd.model.lcia import Impacts, ImpactSet, LCIAMethod, ScopeSet
 
 from ilcdlib.common import OpenEpdImpactSetSupportReader
 from ilcdlib.entity.base_scope_set_reader import BaseIlcdScopeSetsReader
@@ -77,7 +77,8 @@ class IlcdLciaResultsReader(OpenEpdImpactSetSupportReader, BaseIlcdScopeSetsRead
                     unit = a_impact.unit
                     s += a_impact.mean
 
-            scope_set.A1A2A3 = Measurement(mean=s, unit=unit)
+            # Means and units come from validated measurements, the sum needs no validation
+            scope_set.A1A2A3 = Measurement.construct(mean=s, unit=unit)
 
     def _extract_and_set_a1a2a3_impact(self, impacts: dict[str, ScopeSet | dict]) -> None:
         """Set A1A2A3 value if None provided."""
@@ -98,6 +99,5 @@ class IlcdLciaResultsReader(OpenEpdImpactSetSupportReader, BaseIlcdScopeSetsRead
     ) -> Impacts:
         """Read as openEPD ImpactSet object."""
         impact_set = self.get_impact_set(scenario_names)
-        impacts = Impacts(__root__={})
-        impacts.set_impact_set(lcia_method, impact_set)
-        return impacts
+        method = LCIAMethod.get_by_name(lcia_method) if lcia_method is not None else LCIAMethod.UNKNOWN
+        return Impacts.construct(__root__={method: impact_set})
@@ -15,10 +15,13 @@
 #
 import dataclasses
 from enum import StrEnum
-from typing import IO, Literal
+from typing import IO, Callable, Literal
 
 from ilcdlib.xml_parser import T_ET, XmlParser
 
+_VALUE_PARSERS: dict[str, Callable[[str], int | float]] = {"float": float, "integer": int}
+"""Converters of MatML data values by data format, values of other formats are kept as is."""
+
 
 class IlcdStandardMatProperties(StrEnum):
     """Represent ILCD standard material properties."""
@@ -82,6 +85,11 @@ class MatMlReader:
         if material_name is None:
             return None
         result = MatMlMaterial(name=material_name)
+        props_meta: dict[str, T_ET.Element] = {}
+        for meta_el in self.xml_parser.get_all_els(self._entity, "mm:Metadata/mm:PropertyDetails"):
+            meta_id = meta_el.get("id")
+            if meta_id is not None:
+                props_meta.setdefault(meta_id, meta_el)
         all_props_data = self.xml_parser.get_all_els(self._entity, "mm:Material/mm:BulkDetails/mm:PropertyData")
         for prop_el in all_props_data:
             prop_ref = prop_el.attrib.get("property") if prop_el.attrib else None
@@ -89,7 +97,7 @@ class MatMlReader:
             prop_format, prop_value = self.__parse_prop_data(prop_data)
             if prop_ref is None or prop_value is None:
                 continue
-            prop_meta = self.xml_parser.get_el(self._entity, f"mm:Metadata/mm:PropertyDetails[@id='{prop_ref}']")
+            prop_meta = props_meta.get(prop_ref)
             if prop_meta is None:
                 continue
             prop_name = self.xml_parser.get_el_text(prop_meta, "mm:Name")
@@ -108,22 +116,15 @@ class MatMlReader:
     def __map_unit_name(self, unit_name: str | None) -> str | None:
         if unit_name is None:
             return None
-        match unit_name.strip():
-            case "-":
-                return None
-            case _:
-                return unit_name
-
-    def __parse_prop_data(
-        self, prop_data
-    ) -> tuple[Literal["float", "integer", "string", "exponential", "mixed"], str | int | float | None]:
-        prop_format = prop_data.attrib.get("format") if prop_data is not None else None
-        prop_value_raw = prop_data.text if prop_data is not None else None
-        match prop_format:
-            case "float":
-                prop_value = float(prop_value_raw)
-            case "integer":
-                prop_value = int(prop_value_raw)
-            case _:
-                prop_value = prop_value_raw
-        return prop_format, prop_value
+        # "-" denotes a dimensionless property
+        return None if unit_name.strip() == "-" else unit_name
+
+    def __parse_prop_data(self, prop_data: T_ET.Element | None) -> tuple[str | None, str | int | float | None]:
+        if prop_data is None:
+            return None, None
+        prop_format = prop_data.attrib.get("format")
+        prop_value_raw = prop_data.text
+        parse_value = _VALUE_PARSERS.get(prop_format) if prop_format is not None else None
+        if parse_value is None or prop_value_raw is None:
+            return prop_format, prop_value_raw
+        return prop_format, parse_value(prop_value_raw)
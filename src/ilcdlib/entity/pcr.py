@@ -20,7 +20,7 @@ from openepd.model.pcr import Pcr
 from ilcdlib import const
 from ilcdlib.common import BaseIlcdMediumSpecificReader, OpenEpdPcrSupportReader
 from ilcdlib.entity.contact import IlcdContactReader
-from ilcdlib.entity.source import IlcdSourceReader
+from ilcdlib.entity.source import DIGITAL_FILE_PATH, IlcdSourceReader
 from ilcdlib.type import LangDef
 from ilcdlib.utils import create_openepd_attachments, provider_domain_name_from_url
 from ilcdlib.xml_parser import T_ET
@@ -60,15 +60,11 @@ class IlcdPcrReader(OpenEpdPcrSupportReader, IlcdSourceReader):
 
     def get_references_to_digital_files(self) -> list[str]:
         """Return the references to digital files."""
-        els = self._get_all_els(
-            self._entity,
-            (
-                "source:sourceInformation",
-                "source:dataSetInformation",
-                "source:referenceToDigitalFile",
-            ),
-        )
-        return [el.attrib["uri"] for el in els if el.attrib and "uri" in el.attrib]
+        return [
+            uri
+            for el in self.xml_parser.get_all_els(self._entity, DIGITAL_FILE_PATH)
+            if (uri := el.get("uri")) is not None
+        ]
 
     def to_openepd_pcr(self, lang: LangDef, base_url: str | None = None, provider_domain: str | None = None) -> Pcr:
         """Read as OpenEPD Pcr object."""
@@ -80,11 +76,12 @@ class IlcdPcrReader(OpenEpdPcrSupportReader, IlcdSourceReader):
             issuer=issuer,
             attachments=create_openepd_attachments(reference, base_url) if base_url else None,  # type: ignore
         )
-        if provider_domain is None:
-            provider_domain = provider_domain_name_from_url(base_url)
         digital_files = self.get_references_to_digital_files()
         if len(digital_files) > 0 and reference is not None:
             pdf_url = self.data_provider.resolve_entity_url(reference, digital_files[0])
             pcr.set_attachment_if_any(const.PDF_ATTACHMENT, pdf_url)
-        pcr.set_alt_id(provider_domain, self.get_uuid())
+        pcr.set_alt_id(
+            provider_domain if provider_domain is not None else provider_domain_name_from_url(base_url),
+            self.get_uuid(),
+        )
         return pcr
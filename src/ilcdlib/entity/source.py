@@ -21,6 +21,8 @@ from ilcdlib.type import LangDef
 from ilcdlib.utils import none_throws
 from ilcdlib.xml_parser import T_ET
 
+DIGITAL_FILE_PATH = "source:sourceInformation/source:dataSetInformation/source:referenceToDigitalFile"
+
 
 class IlcdSourceReader(IlcdXmlReader):
     """Reader that can parse an ILCD Standard specification from an XML file."""
@@ -67,11 +69,8 @@ class IlcdSourceReader(IlcdXmlReader):
 
     def get_ref_to_digital_file(self) -> str | None:
         """Get the link to the digital file."""
-        el = self._get_el(
-            self._entity,
-            ("source:sourceInformation", "source:dataSetInformation", "source:referenceToDigitalFile"),
-        )
-        return el.attrib.get("uri") if el is not None and el.attrib is not None else None
+        el = self.xml_parser.get_el(self._entity, DIGITAL_FILE_PATH)
+        return el.get("uri") if el is not None else None
 
     def get_digital_file_stream(self) -> IO[bytes] | None:
         """Get the stream to the digital file."""
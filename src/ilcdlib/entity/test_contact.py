@@ -20,6 +20,13 @@ from ilcdlib.entity.contact import IlcdContactReader
 from ilcdlib.epd.reader import IlcdEpdReader
 from ilcdlib.medium.archive import ZipIlcdReader
 
+REVIEWER_REF_PATH = (
+    "process:modellingAndValidation",
+    "process:validation",
+    "process:review",
+    "common:referenceToNameOfReviewerAndInstitution",
+)
+
 
 class ContactReaderTestCase(TestCase):
     TEST_DATA_BASE = Path(__file__).parent.parent.parent / "test_data"
@@ -28,27 +35,21 @@ class ContactReaderTestCase(TestCase):
     epd_reader: IlcdEpdReader
     contact_reader: IlcdContactReader
 
-    def setUp(self):
-        self.epd_reader = IlcdEpdReader(
+    @classmethod
+    def setUpClass(cls):
+        cls.epd_reader = IlcdEpdReader(
             "2eb43850-0ab2-4068-afe5-218d69a096f8",
             "00.01.000",
-            ZipIlcdReader(self.TEST_DATA_BASE / "ibu_with_dependencies.zip"),
+            ZipIlcdReader(cls.TEST_DATA_BASE / "ibu_with_dependencies.zip"),
         )
-        self.contact_reader = IlcdContactReader(
-            self.epd_reader._get_external_tree(
-                self.epd_reader.epd_el_tree,
-                (
-                    "process:modellingAndValidation",
-                    "process:validation",
-                    "process:review",
-                    "common:referenceToNameOfReviewerAndInstitution",
-                ),
-            ),
-            self.epd_reader.data_provider,
+        cls.contact_reader = IlcdContactReader(
+            cls.epd_reader._get_external_tree(cls.epd_reader.epd_el_tree, REVIEWER_REF_PATH),
+            cls.epd_reader.data_provider,
         )
 
-    def tearDown(self) -> None:
-        self.epd_reader.data_provider.close()
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.epd_reader.data_provider.close()
 
     def test_read_contact_fields(self):
         self.assertEqual(self.contact_reader.get_uuid(), "d111dbec-b024-4be5-86c5-752d6eb2cf95")
@@ -16,6 +16,10 @@
 from pathlib import Path
 from unittest import TestCase
 
+from openepd.model.common import Measurement
+from openepd.model.lcia import ScopeSet
+
+from ilcdlib.entity.lcia import IlcdLciaResultsReader
 from ilcdlib.epd.reader import IlcdEpdReader
 from ilcdlib.medium.archive import ZipIlcdReader
 
@@ -26,15 +30,17 @@ class LciaTestCase(TestCase):
 
     epd_reader: IlcdEpdReader
 
-    def setUp(self):
-        self.epd_reader = IlcdEpdReader(
+    @classmethod
+    def setUpClass(cls):
+        cls.epd_reader = IlcdEpdReader(
             "a6ef2d29-49bd-4aaf-ac19-1e3975e4fa51",
             "00.01.000",
-            ZipIlcdReader(self.TEST_DATA_BASE / "epditaly_without_a1a2a3.zip"),
+            ZipIlcdReader(cls.TEST_DATA_BASE / "epditaly_without_a1a2a3.zip"),
         )
 
-    def tearDown(self) -> None:
-        self.epd_reader.data_provider.close()
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.epd_reader.data_provider.close()
 
     def test_missing_a1a2a3_impact(self):
         """If A1A2A3 values is missing, it should be calculated as sum of a1,a2,a3."""
@@ -50,3 +56,16 @@ class LciaTestCase(TestCase):
         for v in impacts_value.values():
             if v and v.get("A1") and v.get("A2") and v.get("A1"):
                 self.assertIsNotNone(v.get("A1A2A3"))
+
+    def test_a1a2a3_ignores_missing_unit(self):
+        """Impact without unit is summed up with the ones which have it, the known unit is kept."""
+        scope_set = ScopeSet.construct(A1=Measurement(mean=1.0, unit=None), A2=Measurement(mean=2.0, unit="kgCO2e"))
+        with self.assertNoLogs(level="WARNING"):
+            IlcdLciaResultsReader._IlcdLciaResultsReader__process_a1a2a3_impact(scope_set)  # type: ignore
+        self.assertEqual(scope_set.A1A2A3, Measurement(mean=3.0, unit="kgCO2e"))
+
+    def test_a1a2a3_units_mismatch(self):
+        scope_set = ScopeSet.construct(A1=Measurement(mean=1.0, unit="kgCO2e"), A2=Measurement(mean=2.0, unit="kgSO2e"))
+        with self.assertLogs(level="WARNING"):
+            IlcdLciaResultsReader._IlcdLciaResultsReader__process_a1a2a3_impact(scope_set)  # type: ignore
+        self.assertIsNone(scope_set.A1A2A3)
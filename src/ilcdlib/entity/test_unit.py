@@ -0,0 +1,61 @@
+#
+#  Copyright 2024 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+from unittest import TestCase
+
+from ilcdlib.entity.unit import IlcdUnitGroupReader
+from ilcdlib.reference_data import get_ilcd_epd_reference_data_provider
+from ilcdlib.xml_parser import XmlParser
+
+UNIT_GROUP_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<unitGroupDataSet xmlns="http://lca.jrc.it/ILCD/UnitGroup" xmlns:common="http://lca.jrc.it/ILCD/Common">
+   <unitGroupInformation>
+      <dataSetInformation>
+         <common:UUID>93a60a57-a3c8-11da-a746-0800200c9a66</common:UUID>
+      </dataSetInformation>
+      <quantitativeReference>
+         <referenceToReferenceUnit>{ref_id}</referenceToReferenceUnit>
+      </quantitativeReference>
+   </unitGroupInformation>
+   <units>
+      <unit dataSetInternalID="0">
+         <name>g</name>
+         <meanValue>0.001</meanValue>
+      </unit>
+      <unit dataSetInternalID="1">
+         <name>kg</name>
+         <meanValue>1.0</meanValue>
+      </unit>
+   </units>
+</unitGroupDataSet>
+"""
+
+
+class UnitGroupReaderTestCase(TestCase):
+    def _get_reader(self, ref_id: str) -> IlcdUnitGroupReader:
+        element = XmlParser().get_xml_tree(UNIT_GROUP_XML.format(ref_id=ref_id).encode())
+        return IlcdUnitGroupReader(element, get_ilcd_epd_reference_data_provider())
+
+    def test_get_reference_unit(self):
+        unit = self._get_reader("1").get_reference_unit(allow_mapping=False)
+        self.assertIsNotNone(unit)
+        self.assertEqual(unit.name, "kg")
+        self.assertEqual(unit.mean_value, 1.0)
+        unit = self._get_reader("0").get_reference_unit(allow_mapping=False)
+        self.assertIsNotNone(unit)
+        self.assertEqual(unit.name, "g")
+
+    def test_get_missing_reference_unit(self):
+        self.assertIsNone(self._get_reader("5").get_reference_unit())
@@ -0,0 +1,54 @@
+#
+#  Copyright 2024 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+import copy
+from pathlib import Path
+from unittest import TestCase
+
+from ilcdlib.entity.validation import IlcdValidationListReader
+from ilcdlib.epd.reader import IlcdEpdReader
+from ilcdlib.medium.archive import ZipIlcdReader
+
+
+class ValidationListReaderTestCase(TestCase):
+    TEST_DATA_BASE = Path(__file__).parent.parent.parent / "test_data"
+    LANG = "de"
+
+    epd_reader: IlcdEpdReader
+
+    @classmethod
+    def setUpClass(cls):
+        cls.epd_reader = IlcdEpdReader(
+            "2eb43850-0ab2-4068-afe5-218d69a096f8",
+            "00.01.000",
+            ZipIlcdReader(cls.TEST_DATA_BASE / "ibu_with_dependencies.zip"),
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.epd_reader.data_provider.close()
+
+    def test_read_multiple_validations(self):
+        validation_reader = self.epd_reader.get_validation_reader()
+        self.assertIsNotNone(validation_reader)
+        single = validation_reader.get_validations(self.LANG)
+        self.assertEqual(len(single), 1)
+
+        validation_el = copy.deepcopy(validation_reader.entity)
+        for _ in range(3):
+            validation_el.append(copy.deepcopy(validation_el[0]))
+        validations = IlcdValidationListReader(validation_el, self.epd_reader.data_provider).get_validations(self.LANG)
+
+        self.assertEqual(validations, single * 4)
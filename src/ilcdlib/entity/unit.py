@@ -15,12 +15,12 @@
 #
 from dataclasses import dataclass
 
-from ilcdlib.common import BaseIlcdMediumSpecificReader, IlcdXmlReader
+from ilcdlib.common import DEFAULT_XML_NS, BaseIlcdMediumSpecificReader, IlcdXmlReader
 from ilcdlib.mapping.common import BaseDataMapper
 from ilcdlib.mapping.units import default_units_mapper
 from ilcdlib.type import LangDef
 from ilcdlib.utils import none_throws
-from ilcdlib.xml_parser import T_ET
+from ilcdlib.xml_parser import T_ET, compile_xpath
 
 
 @dataclass(kw_only=True)
@@ -34,6 +34,17 @@ class UnitDto:
 class IlcdUnitGroupReader(IlcdXmlReader):
     """Read an ILCD Unit Group XML file."""
 
+    _XP_UUID = compile_xpath("ug:unitGroupInformation/ug:dataSetInformation/common:UUID", DEFAULT_XML_NS)
+    _XP_VERSION = compile_xpath(
+        "ug:administrativeInformation/ug:publicationAndOwnership/common:dataSetVersion", DEFAULT_XML_NS
+    )
+    _XP_REF_UNIT_ID = compile_xpath(
+        "ug:unitGroupInformation/ug:quantitativeReference/ug:referenceToReferenceUnit", DEFAULT_XML_NS
+    )
+    _XP_UNIT_BY_ID = compile_xpath("ug:units/ug:unit[@dataSetInternalID=$id]", DEFAULT_XML_NS)
+    _XP_UNIT_NAME = compile_xpath("ug:name", DEFAULT_XML_NS)
+    _XP_UNIT_MEAN_VALUE = compile_xpath("ug:meanValue", DEFAULT_XML_NS)
+
     def __init__(
         self,
         element: T_ET.Element,
@@ -47,16 +58,11 @@ class IlcdUnitGroupReader(IlcdXmlReader):
 
     def get_uuid(self) -> str:
         """Get the UUID of the entity described by this data set."""
-        return none_throws(
-            self._get_text(self._entity, ("ug:unitGroupInformation", "ug:dataSetInformation", "common:UUID"))
-        )
+        return none_throws(self._get_text(self._entity, self._XP_UUID))
 
     def get_version(self) -> str | None:
         """Get the version of the entity described by this data set."""
-        return self._get_text(
-            self._entity,
-            ("ug:administrativeInformation", "ug:publicationAndOwnership", "common:dataSetVersion"),
-        )
+        return self._get_text(self._entity, self._XP_VERSION)
 
     def get_name(self, lang: LangDef) -> str | None:
         """Get the name of the entity described by this data set."""
@@ -66,33 +72,22 @@ class IlcdUnitGroupReader(IlcdXmlReader):
 
     def get_ref_to_reference_unit(self) -> int | None:
         """Get the internal id of the reference flow property."""
-        return self._get_int(
-            self._entity, ("ug:unitGroupInformation", "ug:quantitativeReference", "ug:referenceToReferenceUnit")
-        )
+        return self._get_int(self._entity, self._XP_REF_UNIT_ID)
 
     def get_reference_unit(self, allow_mapping: bool = True) -> UnitDto | None:
         """Get the reader for the reference flow property with the given id."""
         reference_unit_id = self.get_ref_to_reference_unit()
         if reference_unit_id is None:
             return None
-        element = self._get_el(
-            self._entity,
-            (
-                "ug:units",
-                f"ug:unit[@dataSetInternalID='{reference_unit_id}']",
-            ),
-        )
-        if element is None:
+        found = self._XP_UNIT_BY_ID(self._entity, id=str(reference_unit_id))
+        if not found:
             return None
-        unit_name = none_throws(self._get_text(element, "ug:name"))
+        element = found[0]
+        unit_name = none_throws(self._get_text(element, self._XP_UNIT_NAME))
         unit_uuid = self.get_uuid()
         if allow_mapping and unit_uuid is not None and (u_name := self.unit_mapper.map(unit_uuid, unit_name)):
             unit_name = u_name
-        return (
-            UnitDto(
-                name=unit_name,
-                mean_value=none_throws(self._get_float(element, "ug:meanValue")),
-            )
-            if element is not None
-            else None
+        return UnitDto(
+            name=unit_name,
+            mean_value=none_throws(self._get_float(element, self._XP_UNIT_MEAN_VALUE)),
         )
@@ -15,10 +15,10 @@
 #
 from typing import Type
 
-from ilcdlib.common import BaseIlcdMediumSpecificReader, IlcdXmlReader
+from ilcdlib.common import DEFAULT_XML_NS, BaseIlcdMediumSpecificReader, IlcdXmlReader
 from ilcdlib.dto import ValidationDto
 from ilcdlib.type import LangDef
-from ilcdlib.xml_parser import T_ET
+from ilcdlib.xml_parser import T_ET, compile_xpath
 
 from ..const import IlcdTypeOfReview
 from .contact import IlcdContactReader
@@ -27,6 +27,8 @@ from .contact import IlcdContactReader
 class IlcdValidationReader(IlcdXmlReader):
     """Reader that can parse a single ILCD validation specification from an XML file."""
 
+    _XP_REVIEWER_REF = compile_xpath("common:referenceToNameOfReviewerAndInstitution", DEFAULT_XML_NS)
+
     def __init__(
         self,
         element: T_ET.Element,
@@ -42,7 +44,7 @@ class IlcdValidationReader(IlcdXmlReader):
         self, lang: LangDef, base_url: str | None = None, provider_domain: str | None = None
     ) -> ValidationDto | None:
         """Return single validation entity."""
-        tree = self._get_external_tree(self.entity, ("common:referenceToNameOfReviewerAndInstitution",))
+        tree = self._get_external_tree(self.entity, self._XP_REVIEWER_REF)
         if tree is None:
             return None
         if contact := self.contact_reader_cls(tree, self.data_provider):
@@ -14,20 +14,53 @@
 #  limitations under the License.
 #
 import argparse
+from concurrent.futures import Future, ThreadPoolExecutor
+import functools
 from pathlib import Path
+import shutil
+from typing import TYPE_CHECKING
 
 from cli_rack import CLI
 from cli_rack.modular import CliExtension
 from cli_rack.utils import ensure_dir
-from openepd.model.declaration import BaseDeclaration
 
-from ilcdlib.epd.factory import DeclarationReaderFactory
-from ilcdlib.epd.reader import IlcdEpdReader
-from ilcdlib.medium.archive import ZipIlcdReader
-from ilcdlib.medium.soda4lca import Soda4LcaZipReader
+if TYPE_CHECKING:
+    from openepd.model.declaration import BaseDeclaration
+
+    from ilcdlib.epd.factory import DeclarationReaderFactory
+    from ilcdlib.epd.reader import IlcdEpdReader
 
 SUPPORTED_INPUT_FORMATS = ("ilcd+epd",)
 SUPPORTED_OUTPUT_FORMATS = ("openEPD",)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Base URL of soda4LCA node is everything before the dataset detail, resource or process page path.
+# Markers are checked in this order, the first one present in the URL wins regardless of its position.
+_BASE_URL_MARKERS = ("/datasetdetail/", "/resource/", "/showProcess.xhtml")
+
+
+def extract_base_url(doc_ref: str) -> str | None:
+    """Return base URL of the soda4LCA node the document is referenced on, or `None` if it is not recognized."""
+    if not doc_ref.startswith("http"):
+        return None
+    for marker in _BASE_URL_MARKERS:
+        base_url, found, _ = doc_ref.partition(marker)
+        if found:
+            return base_url
+    return None
+
+
+@functools.cache
+def get_reader_factory() -> "DeclarationReaderFactory":
+    """Return the reader factory shared by all invocations of the command."""
+    from ilcdlib.epd.factory import DeclarationReaderFactory
+
+    return DeclarationReaderFactory()
+
+
+def declaration_to_json(declaration: "BaseDeclaration") -> str:
+    """Serialize the declaration to JSON the way the command prints and saves it."""
+    return declaration.json(indent=2, exclude_none=True, exclude_unset=True)
 
 
 class ConvertEpdCliExtension(CliExtension):
@@ -108,6 +141,17 @@ class ConvertEpdCliExtension(CliExtension):
             required=False,
             default=None,
         )
+        parser.add_argument(
+            "--workers",
+            "-w",
+            dest="workers",
+            type=int,
+            help="Number of documents converted concurrently. With more than one worker the output of each document is "
+            "printed once it is converted, in the order documents were given, and progress messages are prefixed with "
+            "the document reference since they may interleave.",
+            required=False,
+            default=1,
+        )
         parser.add_argument(
             "doc",
             metavar="doc",
@@ -127,6 +171,7 @@ class ConvertEpdCliExtension(CliExtension):
         extract_pdf: bool = args.extract_pdf
         target_dir: Path = Path(args.target_dir) if args.target_dir is not None else Path.cwd()
         provider_domain: str | None = args.provider_domain
+        workers: int = args.workers
         if in_format.lower() != "ilcd+epd":
             CLI.fail(f"Input format {in_format} is not supported.", 1)
         if out_format.lower() != "openepd":
@@ -137,27 +182,47 @@ class ConvertEpdCliExtension(CliExtension):
             CLI.fail("Extracting PDF requires saving the input document. Consider adding -s flag", 1)
         if target_dir.is_file():
             CLI.fail(f"Target directory {target_dir} is a file. It must be either dir or nor existing path.", 1)
-        epd_reader_factory = DeclarationReaderFactory()
+        epd_reader_factory = get_reader_factory()
         if dialect is not None and not epd_reader_factory.is_dialect_supported(dialect):
             CLI.fail(f"Dialect {dialect} is not supported.", 3)
-        for doc in doc_refs:
-            self.process_single_doc(
-                doc,
-                epd_reader_factory,
-                dialect=dialect,
-                extract_pdf=extract_pdf,
-                in_format=in_format,
-                lang=lang,
-                out_format=out_format,
-                save=save,
-                target_dir=target_dir,
-                provider_domain=provider_domain,
-            )
+        if workers < 1:
+            CLI.fail("Number of workers must be a positive number.", 1)
+        process_doc = functools.partial(
+            self.process_single_doc,
+            epd_reader_factory=epd_reader_factory,
+            dialect=dialect,
+            extract_pdf=extract_pdf,
+            in_format=in_format,
+            lang=lang,
+            out_format=out_format,
+            save=save,
+            target_dir=target_dir,
+            provider_domain=provider_domain,
+        )
+        if workers == 1 or len(doc_refs) == 1:
+            for doc_ref in doc_refs:
+                process_doc(doc_ref)
+            return
+
+        # Output of every document is printed in the order documents were given. The first failed document cancels
+        # the ones not started yet, documents queued before it are still printed.
+        with ThreadPoolExecutor(max_workers=min(len(doc_refs), workers)) as executor:
+            futures = [executor.submit(process_doc, x, print_result=False, log_prefix=f"[{x}] ") for x in doc_refs]
+
+            def cancel_pending_on_failure(future: Future) -> None:
+                if not future.cancelled() and future.exception() is not None:
+                    for x in futures:
+                        x.cancel()
+
+            for future in futures:
+                future.add_done_callback(cancel_pending_on_failure)
+            for future in futures:
+                CLI.print_data(future.result())
 
     def process_single_doc(
         self,
         doc_ref: str,
-        epd_reader_factory: DeclarationReaderFactory,
+        epd_reader_factory: "DeclarationReaderFactory",
         *,
         dialect: str | None,
         in_format: str,
@@ -167,55 +232,82 @@ class ConvertEpdCliExtension(CliExtension):
         save: bool = False,
         target_dir: Path | None = None,
         provider_domain: str | None = None,
-    ) -> None:
-        CLI.print_info(f"Converting document {doc_ref} from {in_format} to {out_format}.")
+        print_result: bool = True,
+        log_prefix: str = "",
+    ) -> str:
+        """
+        Convert the document and return the resulting JSON.
+
+        :param print_result: If True, the JSON is printed once the document is converted.
+        :param log_prefix: Prefix of the progress messages, identifies the document if several are converted at once.
+        """
+        from ilcdlib.medium.archive import ZipIlcdReader
+        from ilcdlib.medium.soda4lca import Soda4LcaZipReader
+
+        CLI.print_info(f"{log_prefix}Converting document {doc_ref} from {in_format} to {out_format}.")
         reader_cls, dialect = (
             (epd_reader_factory.get_reader_class(dialect), dialect)
             if dialect
             else epd_reader_factory.autodiscover_by_url(doc_ref)
         )
-        CLI.print_info("Effective dialect: " + (dialect if dialect is not None else "Generic"))
-        medium = Soda4LcaZipReader(doc_ref) if doc_ref.startswith("http") else ZipIlcdReader(Path(doc_ref))
+        CLI.print_info(log_prefix + "Effective dialect: " + (dialect if dialect is not None else "Generic"))
+        is_remote = doc_ref.startswith("http")
+        medium = Soda4LcaZipReader(doc_ref) if is_remote else ZipIlcdReader(Path(doc_ref))
         epd_reader = reader_cls(None, None, medium)
         supported_langs = epd_reader.get_supported_langs()
-        if len(supported_langs) == 0:
+        if not supported_langs:
             CLI.fail(f"Input document {doc_ref} Doesn't seem to be correct. No language information detected.", 4)
-        prioritize_english = False
+        supported_langs_set = frozenset(supported_langs)
+        # English goes first when the language is not given explicitly and the document has it, but not as default
+        lang_head: tuple[str, ...] = ()
         if lang is None:
-            prioritize_english = "en" in supported_langs and "en" != supported_langs[0]
             lang = supported_langs[0]
-        elif lang.lower() not in supported_langs:
+            lang_head = ("en",) if lang != "en" and "en" in supported_langs_set else ()
+        elif lang.lower() not in supported_langs_set:
             CLI.fail(
                 f"Language {lang} is not supported by the input document. "
                 f"Supported languages are: {supported_langs}",
                 4,
             )
-        lang_list = [lang, None]
-        if prioritize_english:
-            lang_list.insert(0, "en")
-        CLI.print_info("Language priority: " + ",".join([x if x is not None else "any other" for x in lang_list]))
-        base_url = self.__extract_base_url(doc_ref)
-        open_epd: BaseDeclaration = epd_reader.to_openepd_declaration(
+        lang_list: tuple[str | None, ...] = lang_head + (lang, None)
+        CLI.print_info(
+            log_prefix + "Language priority: " + ",".join([x if x is not None else "any other" for x in lang_list])
+        )
+        base_url = extract_base_url(doc_ref) if is_remote else None
+        open_epd: "BaseDeclaration" = epd_reader.to_openepd_declaration(
             lang_list, base_url=base_url, provider_domain=provider_domain
         )
-        CLI.print_data(open_epd.json(indent=2, exclude_none=True, exclude_unset=True))
+        # Serialize once, the same JSON is printed and saved to the output directory
+        result_json = declaration_to_json(open_epd)
+        if print_result:
+            CLI.print_data(result_json)
         if save:
-            self.save_results(epd_reader, open_epd, extract_pdf=extract_pdf, base_dir=target_dir)
+            self.save_results(
+                epd_reader,
+                open_epd,
+                extract_pdf=extract_pdf,
+                base_dir=target_dir,
+                result_json=result_json,
+                log_prefix=log_prefix,
+            )
+        return result_json
 
     def save_results(
         self,
-        epd_reader: IlcdEpdReader,
-        result: BaseDeclaration,
+        epd_reader: "IlcdEpdReader",
+        result: "BaseDeclaration",
         *,
         extract_pdf: bool = False,
         base_dir: Path | None = None,
+        result_json: str | None = None,
+        log_prefix: str = "",
     ):
-        if base_dir is None:
-            base_dir = Path.cwd()
-        output_dir = base_dir / Path(epd_reader.get_uuid())
-        ensure_dir(output_dir)
+        from ilcdlib.medium.archive import ZipIlcdReader
+        from ilcdlib.medium.soda4lca import Soda4LcaZipReader
+
+        output_dir = self.get_output_dir(epd_reader, base_dir)
         with open(output_dir / "openEPD.json", "w") as f:
-            f.write(result.json(indent=2, exclude_none=True, exclude_unset=True))
+            f.write(result_json if result_json is not None else declaration_to_json(result))
         if isinstance(epd_reader.data_provider, ZipIlcdReader):
             epd_reader.data_provider.save_to(output_dir / "ilcd_epd.zip")
         if extract_pdf:
@@ -228,24 +320,20 @@ class ConvertEpdCliExtension(CliExtension):
                     pdf_stream = None
             if pdf_stream is not None:
                 with open(output_dir / "original.pdf", "wb") as f, pdf_stream:
-                    f.write(pdf_stream.read())
+                    shutil.copyfileobj(pdf_stream, f, COPY_BUFFER_SIZE)
             # PCR PDF
             pcr_reader = epd_reader.get_pcr_reader()
             if pcr_reader:
                 pdf_stream = pcr_reader.get_digital_file_stream()
                 if pdf_stream:
                     with open(output_dir / "pcr.pdf", "wb") as f, pdf_stream:
-                        f.write(pdf_stream.read())
-        CLI.print_info("Output saved to " + str(output_dir.absolute()))
-
-    def __extract_base_url(self, doc_ref: str) -> str | None:
-        if doc_ref.startswith("http"):
-            if "/datasetdetail/" in doc_ref:
-                return doc_ref.split("/datasetdetail/", 1)[0]
-            elif "/resource/" in doc_ref:
-                return doc_ref.split("/resource/", 1)[0]
-            elif "/showProcess.xhtml" in doc_ref:
-                return doc_ref.split("/showProcess.xhtml", 1)[0]
-            return None
-        else:
-            return None
+                        shutil.copyfileobj(pdf_stream, f, COPY_BUFFER_SIZE)
+        CLI.print_info(log_prefix + "Output saved to " + str(output_dir.absolute()))
+
+    def get_output_dir(self, epd_reader: "IlcdEpdReader", base_dir: Path | None = None) -> Path:
+        """Return the directory results of the given document are saved to, the directory is created if needed."""
+        if base_dir is None:
+            base_dir = Path.cwd()
+        output_dir = base_dir / Path(epd_reader.get_uuid())
+        ensure_dir(output_dir)
+        return output_dir
@@ -26,29 +26,29 @@ from ilcdlib.extension import IlcdEpdExtension
 TSource = TypeVar("TSource", bound=BaseDeclaration)
 TTarget = TypeVar("TTarget", bound=BaseDeclaration)
 
+_GEOGRAPHY_VALUES: frozenset[str] = frozenset(x.value for x in Geography)
+_MISSING = object()
+
 
 class BaseDeclarationConvertor(Generic[TSource, TTarget], metaclass=abc.ABCMeta):
     """Base class for declaration convertors."""
 
     def _remove_property(self, property_name: str, raw_object: dict[str, Any]) -> bool:
-        if property_name in raw_object:
-            del raw_object[property_name]
-            return True
-        return False
+        return raw_object.pop(property_name, _MISSING) is not _MISSING
 
     def _rename_property(self, old_name: str, new_name: str, raw_object: dict[str, Any]) -> bool:
-        if old_name in raw_object:
-            raw_object[new_name] = raw_object[old_name]
-            del raw_object[old_name]
-            return True
-        return False
+        value = raw_object.pop(old_name, _MISSING)
+        if value is _MISSING:
+            return False
+        raw_object[new_name] = value
+        return True
 
     def _obj_to_raw(self, obj: TSource) -> dict[str, Any]:
         return obj.to_serializable(exclude_unset=True, exclude_defaults=True, by_alias=True)
 
     def _normalize_ilcd_geography(self, ilcd_geography: str) -> list[Geography] | None:
         """Convert ILCD geography string into openEPD geography."""
-        if ilcd_geography in list(Geography):
+        if ilcd_geography in _GEOGRAPHY_VALUES:
             return [Geography(ilcd_geography)]
         if ilcd_geography == "RER":
             return [Geography.m49_150]  # 150 -Europe
@@ -71,15 +71,16 @@ class EpdToGenericEstimateConvertor(BaseDeclarationConvertor[EpdWithDeps, Generi
         self._rename_property("product_name", "name", raw_obj)
         self._rename_property("third_party_verifier", "reviewer", raw_obj)
         self._rename_property("third_party_verifier_email", "reviewer_email", raw_obj)
+        ilcd_ext = source.get_ext_or_empty(IlcdEpdExtension)
         # Set geography
-        ilcd_geography = source.get_ext_or_empty(IlcdEpdExtension).production_location
+        ilcd_geography = ilcd_ext.production_location
         if ilcd_geography:
             openepd_geography = self._normalize_ilcd_geography(ilcd_geography)
             if openepd_geography:
                 raw_obj["geography"] = openepd_geography
         # Publisher
-        publishers = source.get_ext_or_empty(IlcdEpdExtension).epd_publishers or []
-        if len(publishers) > 0:
+        publishers = ilcd_ext.epd_publishers or []
+        if publishers:
             raw_obj["publisher"] = publishers[0].to_serializable(exclude_unset=True, exclude_defaults=True)
             self._remove_property("manufacturer", raw_obj)
         else:
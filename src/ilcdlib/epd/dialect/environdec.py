@@ -14,23 +14,62 @@
 #  limitations under the License.
 #
 import datetime
-import io
+import functools
+import json
 import re
-from typing import IO
-
-import requests
+import threading
+from typing import IO, TYPE_CHECKING
 
+from ilcdlib.common import DEFAULT_XML_NS
 from ilcdlib.epd.reader import IlcdEpdReader
 from ilcdlib.type import LangDef
+from ilcdlib.utils import parse_line_end_date
+from ilcdlib.xml_parser import compile_localized_xpath, compile_xpath
+
+if TYPE_CHECKING:
+    import requests
+
+_thread_local = threading.local()
+
+
+def _get_http_session() -> "requests.Session":
+    """
+    Return HTTP session of the current thread, so connections to Environdec hosts are kept alive between requests.
+
+    requests sessions are not thread safe, so one session is kept per thread and reused by all readers.
+    """
+    session = getattr(_thread_local, "http_session", None)
+    if session is None:
+        # requests is only needed to download documents, so it is not imported together with the reader
+        import requests
+
+        session = requests.Session()
+        _thread_local.http_session = session
+    return session
 
 
 class EnvirondecIlcdXmlEpdReader(IlcdEpdReader):
     """Reader for EPDs in the Environdec specific ILCD XML format."""
 
+    URL_SIGNATURES = ("environdec",)
     _TIME_REPR_DESC_DELIMITER = "\r\n"
     _PATTERN_ENVIRONDEC_DETAIL_URL_V1 = re.compile(r"https://www.environdec.com/library/_\?Epd=\d+")
     _PATTERN_ENVIRONDEC_HTML_FRIENDLY_URL = re.compile(r'"friendlyUrl": ?"(epd\d+)"')
     _PATTERN_ENVIRONDEC_DETAIL_URL_v2 = re.compile(r"https://www.environdec.com/Detail/epd\d+")
+    _XP_DATA_SOURCE_REF = compile_xpath(
+        "process:modellingAndValidation/process:dataSourcesTreatmentAndRepresentativeness"
+        "/process:referenceToDataSource",
+        DEFAULT_XML_NS,
+    )
+    _XP_SOURCE_DESCRIPTION = compile_localized_xpath(
+        "source:sourceInformation/source:dataSetInformation/source:sourceDescriptionOrComment", DEFAULT_XML_NS
+    )
+    _XP_SOURCE_DIGITAL_FILE_REF = compile_xpath(
+        "source:sourceInformation/source:dataSetInformation/source:referenceToDigitalFile", DEFAULT_XML_NS
+    )
+    _XP_TIME_REPR_DESCRIPTION = compile_localized_xpath(
+        "process:processInformation/process:time/common:timeRepresentativenessDescription", DEFAULT_XML_NS
+    )
 
     def get_epd_document_stream(self) -> IO[bytes] | None:
         """
@@ -41,24 +80,26 @@ class EnvirondecIlcdXmlEpdReader(IlcdEpdReader):
 
         We will not use this method to get the EPD document link for OpenEPD,
         because it is a responsibility of the client to get related documents.
+
+        The document is read directly from the connection, see `HttpResponseStream`. The caller must close the stream.
         """
 
         link = self.get_url_attachment("en")
         if not link:
             return None
 
-        if re.match(self._PATTERN_ENVIRONDEC_DETAIL_URL_V1, link):
+        if self._PATTERN_ENVIRONDEC_DETAIL_URL_V1.match(link):
             # If we have an older url to product page, we need to parse the html response to get the friendly url
             # For example, https://www.environdec.com/library/_?Epd=14879
-            response = requests.get(link)
+            response = _get_http_session().get(link)
             if not response.status_code == 200:
                 return None
-            foreign_ids = re.findall(self._PATTERN_ENVIRONDEC_HTML_FRIENDLY_URL, response.text)
-            if not foreign_ids:
+            friendly_url_match = self._PATTERN_ENVIRONDEC_HTML_FRIENDLY_URL.search(response.text)
+            if friendly_url_match is None:
                 return None
-            foreign_id = foreign_ids[0]
+            foreign_id = friendly_url_match.group(1)
 
-        elif re.match(self._PATTERN_ENVIRONDEC_DETAIL_URL_v2, link):
+        elif self._PATTERN_ENVIRONDEC_DETAIL_URL_v2.match(link):
             # If we have a newer url to product page, we can get it using url itself
             # For example, https://www.environdec.com/library/epd1452
             foreign_id = link.strip("/").split("/")[-1]
@@ -66,34 +107,28 @@ class EnvirondecIlcdXmlEpdReader(IlcdEpdReader):
             # Otherwise, we can't get the foreign id
             return None
 
-        response = requests.get(f"https://api.environdec.com/api/v1/EPDLibrary/EPD/{foreign_id}")
+        response = _get_http_session().get(f"https://api.environdec.com/api/v1/EPDLibrary/EPD/{foreign_id}")
         if response.status_code != 200:
             return None
-        document_id = response.json()["documents"][0]["id"]
+        document_id = json.loads(response.content)["documents"][0]["id"]
         pdf_link = f"https://api.environdec.com/api/v1/EPDLibrary/Files/{document_id}/Data"
-        pdf_response = requests.get(pdf_link)
+        pdf_response = _get_http_session().get(pdf_link, stream=True)
         if pdf_response.status_code != 200:
+            pdf_response.close()
             return None
-        return io.BytesIO(pdf_response.content)
+        # Body is not loaded into memory, the caller reads it directly from the connection
+        from ilcdlib.http_common import HttpResponseStream
+
+        pdf_response.raw.decode_content = True
+        return HttpResponseStream.open(pdf_response.raw)
 
     def _get_url_attachments_v1(self, lang: LangDef) -> str | None:
         """Get the URL attachment from the Environdec specific ILCD XML document when the old link format is used."""
-        element = self._get_external_tree(
-            self.epd_el_tree,
-            (
-                "process:modellingAndValidation",
-                "process:dataSourcesTreatmentAndRepresentativeness",
-                "process:referenceToDataSource",
-            ),
-        )
+        element = self._get_external_tree(self.epd_el_tree, self._XP_DATA_SOURCE_REF)
         if not element:
             return None
 
-        url = self._get_localized_text(
-            element,
-            ("source:sourceInformation", "source:dataSetInformation", "source:sourceDescriptionOrComment"),
-            lang,
-        )
+        url = self._get_localized_text(element, self._XP_SOURCE_DESCRIPTION, lang)
 
         return url
 
@@ -111,10 +146,7 @@ class EnvirondecIlcdXmlEpdReader(IlcdEpdReader):
         if not external_tree:
             return None
 
-        el = self._get_el(
-            external_tree,
-            ("source:sourceInformation", "source:dataSetInformation", "source:referenceToDigitalFile"),
-        )
+        el = self._get_el(external_tree, self._XP_SOURCE_DIGITAL_FILE_REF)
         url = el.attrib.get("uri") if el is not None and el.attrib is not None else None
         return url
 
@@ -131,38 +163,31 @@ class EnvirondecIlcdXmlEpdReader(IlcdEpdReader):
 
     def get_validity_ends_date(self) -> datetime.date | None:
         """Return the date the EPD is valid until."""
-        descr = self.__get_time_repr_description()
-        if descr and self._TIME_REPR_DESC_DELIMITER in descr:
-            try:
-                date_str = descr.split(self._TIME_REPR_DESC_DELIMITER)[1].strip().rsplit(" ", 1)[-1].strip()
-                return datetime.date.fromisoformat(date_str)
-            except Exception:
-                pass
-        return super().get_validity_ends_date()
+        valid_until = self._time_repr_dates[1]
+        return valid_until if valid_until is not None else super().get_validity_ends_date()
 
     def get_date_published(self) -> datetime.date | None:
         """Return the date the EPD was published."""
-        descr = self.__get_time_repr_description()
-        if descr and self._TIME_REPR_DESC_DELIMITER in descr:
-            try:
-                date_str = descr.split(self._TIME_REPR_DESC_DELIMITER)[0].strip().rsplit(" ", 1)[-1].strip()
-                return datetime.date.fromisoformat(date_str)
-            except Exception:
-                pass
-        return super().get_date_published()
-
-    @classmethod
-    def is_known_url(cls, url: str) -> bool:
-        """Return whether the URL recognized as a known Environdec URL."""
-        return "environdec" in url.lower()
-
-    def __get_time_repr_description(self) -> str | None:
-        return self._get_localized_text(
-            self.epd_el_tree,
-            (
-                "process:processInformation",
-                "process:time",
-                "common:timeRepresentativenessDescription",
-            ),
-            ("en", None),
-        )
+        published = self._time_repr_dates[0]
+        return published if published is not None else super().get_date_published()
+
+    @functools.cached_property
+    def _time_repr_dates(self) -> tuple[datetime.date | None, datetime.date | None]:
+        """
+        Publication and validity end dates from the time representativeness description.
+
+        Environdec puts them at the end of the first and second lines of the description respectively.
+        """
+        descr = self._time_repr_description
+        if not descr:
+            return None, None
+        published_line, delimiter, rest = descr.partition(self._TIME_REPR_DESC_DELIMITER)
+        if not delimiter:
+            return None, None
+        valid_until_line = rest.partition(self._TIME_REPR_DESC_DELIMITER)[0]
+        return parse_line_end_date(published_line), parse_line_end_date(valid_until_line)
+
+    @functools.cached_property
+    def _time_repr_description(self) -> str | None:
+        """Time representativeness description, both publication and validity dates are read from it."""
+        return self._get_localized_text(self.epd_el_tree, self._XP_TIME_REPR_DESCRIPTION, ("en", None))
@@ -15,28 +15,31 @@
 #
 from typing import Any
 
+from ilcdlib.common import DEFAULT_XML_NS
 from ilcdlib.dto import OpenEpdIlcdOrg
 from ilcdlib.entity.contact import IlcdContactReader
 from ilcdlib.entity.flow import UriBasedIlcdFlowReader
 from ilcdlib.epd.reader import IlcdEpdReader
 from ilcdlib.type import LangDef
+from ilcdlib.xml_parser import compile_localized_xpath
 
 
 class EpdDenmarkIlcdXmlEpdReader(IlcdEpdReader):
     """Reader for EPDs in the Denmark specific ILCD XML format."""
 
+    # Note: While Denmark EPDs contain the term "ecosmdp" in their URLs, this is not a unique identifier,
+    # and no specific URL pattern can be reliably associated with Denmark EPDs alone.
+    URL_SIGNATURES = ()
     DENMARK_LANG_CODE: str = "da"
+    _XP_REGISTRATION_AUTHORITY_NAME = compile_localized_xpath(
+        "process:administrativeInformation/process:publicationAndOwnership/common:referenceToRegistrationAuthority"
+        "/common:shortDescription",
+        DEFAULT_XML_NS,
+    )
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs, flow_reader_cls=UriBasedIlcdFlowReader)
 
-    @classmethod
-    def is_known_url(cls, url: str) -> bool:
-        """Return whether the URL recognized as a known Denmark URL."""
-        # Note: While Denmark EPDs contain the term "ecosmdp" in their URLs, this is not a unique identifier,
-        # and no specific URL pattern can be reliably associated with Denmark EPDs alone.
-        return False
-
     def get_program_operator(
         self,
         program_operator_reader: IlcdContactReader | None,
@@ -47,14 +50,7 @@ class EpdDenmarkIlcdXmlEpdReader(IlcdEpdReader):
         """Return the program operator."""
         if not program_operator_reader:
             program_operator_name = self._get_localized_text(
-                self.epd_el_tree,
-                (
-                    "process:administrativeInformation",
-                    "process:publicationAndOwnership",
-                    "common:referenceToRegistrationAuthority",
-                    "common:shortDescription",
-                ),
-                ("en", None),
+                self.epd_el_tree, self._XP_REGISTRATION_AUTHORITY_NAME, ("en", None)
             )
             if program_operator_name:
                 return OpenEpdIlcdOrg(name=program_operator_name)
@@ -13,44 +13,27 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
+from types import MappingProxyType
+
+from ilcdlib.common import DEFAULT_XML_NS
 from ilcdlib.epd.reader import IlcdEpdReader
 from ilcdlib.type import LangDef
+from ilcdlib.xml_parser import compile_xpath
 
 
 class EpdItalyIlcdXmlEpdReader(IlcdEpdReader):
     """Reader for EPDs in the EpdItaly specific ILCD XML format."""
 
-    @classmethod
-    def is_known_url(cls, url: str) -> bool:
-        """Return whether the URL recognized as a known Environdec URL."""
-        return "epditaly" in url.lower()
+    URL_SIGNATURES = ("epditaly",)
+    XML_NS_EXTRA = MappingProxyType({"epd2019": DEFAULT_XML_NS["epd2019_indata"]})
 
-    def post_init(self):
-        """Configure EpdItaly specific settings."""
-        self.xml_parser.xml_ns["epd2019"] = self.xml_parser.xml_ns["epd2019_indata"]
+    _XP_SCENARIO_SHORT_NAMES = compile_xpath(
+        "process:processInformation/process:dataSetInformation/common:other/epd2013:scenarios/epd2013:scenario"
+        "/@epd2013:name",
+        DEFAULT_XML_NS,
+    )
 
     def get_scenario_names(self, lang: LangDef) -> dict[str, str]:
         """Return dictionary with mapping short scenario names to full names in given language."""
-        scenarios = self._get_all_els(
-            self.epd_el_tree,
-            (
-                "process:processInformation",
-                "process:dataSetInformation",
-                "common:other",
-                "epd2013:scenarios",
-                "epd2013:scenario",
-            ),
-        )
-
-        result: dict[str, str] = dict()
-
-        for scenario in scenarios:
-            if not scenario.attrib:
-                continue
-
-            short_name = scenario.attrib.get("{http://www.iai.kit.edu/EPD/2013}name")
-
-            if short_name:
-                result[short_name] = short_name
-
-        return result
+        # EpdItaly doesn't provide scenario descriptions, so short names are used as full names as well
+        return {x: x for x in self._XP_SCENARIO_SHORT_NAMES(self.epd_el_tree) if x}
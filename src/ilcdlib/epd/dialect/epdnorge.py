@@ -14,13 +14,23 @@
 #  limitations under the License.
 #
 import datetime
+import functools
+import re
 
 from openepd.model.pcr import Pcr
 
+from ilcdlib.common import DEFAULT_XML_NS
 from ilcdlib.dto import MappedCategory, OpenEpdIlcdOrg, ValidationDto
 from ilcdlib.epd.reader import IlcdEpdReader
 from ilcdlib.mapping.category import CsvCategoryMapper
 from ilcdlib.type import LangDef
+from ilcdlib.utils import parse_line_end_date
+from ilcdlib.xml_parser import compile_localized_xpath
+
+# Boilerplate EPD Norge adds to PCR names.
+_PATTERN_PCR_NAME_BOILERPLATE = re.compile(
+    "Product descriptions and scenarios are based on|This also applies for inorganic coatings"
+)
 
 
 class EpdNorgeCategoryMapper(CsvCategoryMapper):
@@ -31,22 +41,33 @@ class EpdNorgeCategoryMapper(CsvCategoryMapper):
         # For EpdNorge the input might be either just uid or uid separated by space from name.
         # e.g. '071f9a38-08af-4ee5-909a-9884e93816c0 Bygg / Teknisk-kjemiske byggevareprodukter'
         # In that case we drop the name and use just uuid
-        if " " in input_value:
-            input_value = input_value.split(" ")[0]
+        input_value = input_value.partition(" ")[0]
         return super().map(input_value, default_value)
 
 
 class EpdNorgeIlcdXmlEpdReader(IlcdEpdReader):
     """Reader for EPDs in the EpdNorge specific ILCD XML format."""
 
+    URL_SIGNATURES = ("epdnorway", "digi-norge")
     EPDNORGE_CLASSIFICATION_NAME = "epdnorge"
     _TIME_REPR_DESC_DELIMITER = "\r\n"
-
-    @classmethod
-    def is_known_url(cls, url: str) -> bool:
-        """Return whether the URL recognized as a known EPD Norge URL."""
-        normalized_url = url.lower()
-        return "epdnorway" in normalized_url or "digi-norge" in normalized_url
+    # Name of the reviewer of the first review, reached from the process root in a single traversal
+    _XP_REVIEWER_NAME = compile_localized_xpath(
+        "process:modellingAndValidation/process:validation/process:review[1]"
+        "/common:referenceToNameOfReviewerAndInstitution[1]/common:shortDescription",
+        DEFAULT_XML_NS,
+    )
+    _XP_TECHNOLOGICAL_APPLICABILITY = compile_localized_xpath(
+        "process:processInformation/process:technology/process:technologicalApplicability", DEFAULT_XML_NS
+    )
+    _XP_TIME_REPR_DESCRIPTION = compile_localized_xpath(
+        "process:processInformation/process:time/common:timeRepresentativenessDescription", DEFAULT_XML_NS
+    )
+    _XP_DATA_GENERATOR_NAME = compile_localized_xpath(
+        "process:administrativeInformation/process:dataGenerator"
+        "/common:referenceToPersonOrEntityGeneratingTheDataSet/common:shortDescription",
+        DEFAULT_XML_NS,
+    )
 
     @classmethod
     def _create_category_mapper(cls, classification_name: str) -> CsvCategoryMapper | None:
@@ -60,78 +81,62 @@ class EpdNorgeIlcdXmlEpdReader(IlcdEpdReader):
 
         EPD Norge contains personal info instead of organization info.
         """
-        validation_reader = self.get_validation_reader()
-        validation_el = validation_reader.entity if validation_reader else None
-        reviewer_el = (
-            self._get_el(validation_el[0], ("common:referenceToNameOfReviewerAndInstitution",))
-            if validation_el
-            else None
-        )
         third_party_verifier = super().get_third_party_verifier(validations)
-        if reviewer_el:
-            reviewer_name = self._get_localized_text(reviewer_el, ("common:shortDescription",), ("en", None))
-            if not reviewer_name:
-                return third_party_verifier
-            normalized_reviewer_name = reviewer_name.split("-")[0].strip()
-            if not third_party_verifier:
-                third_party_verifier = OpenEpdIlcdOrg(name=normalized_reviewer_name)
-            else:
-                third_party_verifier.name = normalized_reviewer_name
+        normalized_reviewer_name = self._normalized_reviewer_name
+        if normalized_reviewer_name is None:
+            return third_party_verifier
+        if not third_party_verifier:
+            third_party_verifier = OpenEpdIlcdOrg(name=normalized_reviewer_name)
+        else:
+            third_party_verifier.name = normalized_reviewer_name
         return third_party_verifier
 
+    @functools.cached_property
+    def _normalized_reviewer_name(self) -> str | None:
+        """Reviewer name without the institution suffix, it does not depend on the parsed validations."""
+        reviewer_name = self._get_localized_text(self.epd_el_tree, self._XP_REVIEWER_NAME, ("en", None))
+        if not reviewer_name:
+            return None
+        return reviewer_name.partition("-")[0].strip()
+
     def get_product_description(self, lang: LangDef) -> str | None:
         """Return the product description in the given language."""
-        return self._get_localized_text(
-            self.epd_el_tree,
-            ("process:processInformation", "process:technology", "process:technologicalApplicability"),
-            lang,
-        )
-
-    def _get_time_repr_description(self) -> str | None:
-        return self._get_localized_text(
-            self.epd_el_tree,
-            (
-                "process:processInformation",
-                "process:time",
-                "common:timeRepresentativenessDescription",
-            ),
-            ("en", None),
-        )
+        return self._get_localized_text(self.epd_el_tree, self._XP_TECHNOLOGICAL_APPLICABILITY, lang)
+
+    @functools.cached_property
+    def _time_repr_description(self) -> str | None:
+        """Time representativeness description, both publication and validity dates are read from it."""
+        return self._get_localized_text(self.epd_el_tree, self._XP_TIME_REPR_DESCRIPTION, ("en", None))
 
     def get_validity_ends_date(self) -> datetime.date | None:
         """Return the date the EPD is valid until."""
-        descr = self._get_time_repr_description()
-        if descr and self._TIME_REPR_DESC_DELIMITER in descr:
-            try:
-                date_str = descr.split(self._TIME_REPR_DESC_DELIMITER)[1].strip().rsplit(" ", 1)[-1].strip()
-                return datetime.date.fromisoformat(date_str)
-            except Exception:
-                pass
-        return super().get_validity_ends_date()
+        valid_until = self._time_repr_dates[1]
+        return valid_until if valid_until is not None else super().get_validity_ends_date()
 
     def get_date_published(self) -> datetime.date | None:
         """Return the date the EPD was published."""
-        descr = self._get_time_repr_description()
-        if descr and self._TIME_REPR_DESC_DELIMITER in descr:
-            try:
-                date_str = descr.split(self._TIME_REPR_DESC_DELIMITER)[0].strip().rsplit(" ", 1)[-1].strip()
-                return datetime.date.fromisoformat(date_str)
-            except Exception:
-                pass
-        return super().get_date_published()
+        published = self._time_repr_dates[0]
+        return published if published is not None else super().get_date_published()
+
+    @functools.cached_property
+    def _time_repr_dates(self) -> tuple[datetime.date | None, datetime.date | None]:
+        """
+        Publication and validity end dates from the time representativeness description.
+
+        EPD Norge puts them at the end of the first and second lines of the description respectively.
+        """
+        descr = self._time_repr_description
+        if not descr:
+            return None, None
+        published_line, delimiter, rest = descr.partition(self._TIME_REPR_DESC_DELIMITER)
+        if not delimiter:
+            return None, None
+        valid_until_line = rest.partition(self._TIME_REPR_DESC_DELIMITER)[0]
+        return parse_line_end_date(published_line), parse_line_end_date(valid_until_line)
 
     def get_data_entry_by(self, lang: LangDef, base_url: str | None = None) -> OpenEpdIlcdOrg | None:
         """Return the data entry by org."""
-        developer = self._get_localized_text(
-            self.epd_el_tree,
-            (
-                "process:administrativeInformation",
-                "process:dataGenerator",
-                "common:referenceToPersonOrEntityGeneratingTheDataSet",
-                "common:shortDescription",
-            ),
-            ("en", None),
-        )
+        developer = self._get_localized_text(self.epd_el_tree, self._XP_DATA_GENERATOR_NAME, ("en", None))
         if developer:
             return OpenEpdIlcdOrg(name=developer)
         return super().get_data_entry_by(lang, base_url)
@@ -140,9 +145,5 @@ class EpdNorgeIlcdXmlEpdReader(IlcdEpdReader):
         """Return the PCR."""
         pcr = super().get_pcr(lang, base_url)
         if pcr is not None and pcr.name:
-            pcr.name = (
-                pcr.name.replace("Product descriptions and scenarios are based on", "")
-                .replace("This also applies for inorganic coatings", "")
-                .strip()
-            )
+            pcr.name = _PATTERN_PCR_NAME_BOILERPLATE.sub("", pcr.name).strip()
         return pcr
@@ -13,17 +13,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
+from types import MappingProxyType
+
+from ilcdlib.common import DEFAULT_XML_NS
 from ilcdlib.epd.reader import IlcdEpdReader
 
 
 class IndataIlcdXmlEpdReader(IlcdEpdReader):
     """Reader for EPDs in the Indata specific ILCD XML format."""
 
-    def post_init(self):
-        """Configure Indata specific settings."""
-        self.xml_parser.xml_ns["epd2019"] = "http://www.indata.network/EPD/2019"
-
-    @classmethod
-    def is_known_url(cls, url: str) -> bool:
-        """Return whether the URL recognized as a known Environdec URL."""
-        return "indata" in url.lower()
+    URL_SIGNATURES = ("indata",)
+    XML_NS_EXTRA = MappingProxyType({"epd2019": DEFAULT_XML_NS["epd2019_indata"]})
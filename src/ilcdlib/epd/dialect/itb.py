@@ -15,23 +15,25 @@
 #
 from typing import Any
 
+from ilcdlib.common import DEFAULT_XML_NS
 from ilcdlib.dto import IlcdContactInfo, ValidationDto
 from ilcdlib.entity.flow import UriBasedIlcdFlowReader
 from ilcdlib.epd.reader import IlcdEpdReader
 from ilcdlib.type import LangDef
+from ilcdlib.xml_parser import compile_localized_xpath
 
 
 class ItbIlcdXmlEpdReader(IlcdEpdReader):
     """Reader for EPDs in the Itb specific ILCD XML format."""
 
+    URL_SIGNATURES = ("itb",)
+    _XP_TECHNOLOGICAL_APPLICABILITY = compile_localized_xpath(
+        "process:processInformation/process:technology/process:technologicalApplicability", DEFAULT_XML_NS
+    )
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs, flow_reader_cls=UriBasedIlcdFlowReader)
 
-    @classmethod
-    def is_known_url(cls, url: str) -> bool:
-        """Return whether the URL recognized as a known Itb URL."""
-        return "itb" in url.lower()
-
     def get_third_party_verifier_email(self, validations: list[ValidationDto]) -> str | None:
         """
         Return first third party verifier email.
@@ -48,8 +50,4 @@ class ItbIlcdXmlEpdReader(IlcdEpdReader):
 
     def get_product_description(self, lang: LangDef) -> str | None:
         """Return the product description in the given language."""
-        return self._get_localized_text(
-            self.epd_el_tree,
-            ("process:processInformation", "process:technology", "process:technologicalApplicability"),
-            lang,
-        )
+        return self._get_localized_text(self.epd_el_tree, self._XP_TECHNOLOGICAL_APPLICABILITY, lang)
@@ -13,8 +13,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
-from typing import MutableMapping
+from types import MappingProxyType
 
+from ilcdlib.common import DEFAULT_XML_NS
 from ilcdlib.dto import MappedCategory, ProductClassDef
 from ilcdlib.epd.reader import IlcdEpdReader
 from ilcdlib.mapping.category import CsvCategoryMapper
@@ -37,41 +38,29 @@ class OekobauDatCategoryMapper(CsvCategoryMapper):
         """Map the oekobaudat classifier to a list of MappedCategory objects."""
         # We expect just class ID (like 1.2.3) however we might get ID and name separated by space like "1.2.3 Cement"
         # so we need to get rid of the name before actual mapping
-        if " " in input_value:
-            input_value = input_value.split(" ")[0]
+        input_value = input_value.partition(" ")[0]
         return super().map(input_value, default_value)
 
 
 class OekobauDatIlcdXmlEpdReader(IlcdEpdReader):
     """Reader for EPDs in the Oekobau.DAT specific ILCD XML format."""
 
-    OEKOBAUDAT_CLASSIFICATION_NAME = "oekobau.dat"
-
-    @classmethod
-    def is_known_url(cls, url: str) -> bool:
-        """Return whether the URL recognized as a known Environdec URL."""
-        return "oekobaudat" in url.lower()
+    URL_SIGNATURES = ("oekobaudat",)
+    XML_NS_EXTRA = MappingProxyType({"epd2019": DEFAULT_XML_NS["epd2019_indata"]})
 
-    def post_init(self):
-        """Configure Oekobau.DAT specific settings."""
-        self.xml_parser.xml_ns["epd2019"] = self.xml_parser.xml_ns["epd2019_indata"]
+    OEKOBAUDAT_CLASSIFICATION_NAME = "oekobau.dat"
 
-    def _product_classes_to_openepd(self, classes: dict[str, list[ProductClassDef]]) -> MutableMapping[str, str]:
+    def _product_class_to_openepd(self, classification_name: str, class_defs: list[ProductClassDef]) -> tuple[str, str]:
         """
-        Convert the product classes to OpenEPD format.
+        Convert the product class to OpenEPD format.
 
         The Oekobau.DAT format according to openEPD is a string containing full id and
         the name of the most specific class. Example: "1.1.01 Cement"
         """
-        result = super()._product_classes_to_openepd(classes)
-        for classification_name, class_defs in classes.items():
-            if classification_name.lower() == self.OEKOBAUDAT_CLASSIFICATION_NAME and len(class_defs) > 0:
-                last_class = class_defs[-1]
-                del result[classification_name]
-                result[self.OEKOBAUDAT_CLASSIFICATION_NAME] = " ".join(
-                    (none_throws(last_class.id), none_throws(last_class.name))
-                )
-        return result
+        if classification_name.lower() != self.OEKOBAUDAT_CLASSIFICATION_NAME:
+            return super()._product_class_to_openepd(classification_name, class_defs)
+        last_class = class_defs[-1]
+        return self.OEKOBAUDAT_CLASSIFICATION_NAME, " ".join((none_throws(last_class.id), none_throws(last_class.name)))
 
     @classmethod
     def _create_category_mapper(cls, classification_name: str) -> CsvCategoryMapper | None:
@@ -13,7 +13,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
-from typing import Type
+import re
+from types import MappingProxyType
+from typing import Mapping, Type
 
 from ilcdlib.epd.dialect.environdec import EnvirondecIlcdXmlEpdReader
 from ilcdlib.epd.dialect.epddenmark import EpdDenmarkIlcdXmlEpdReader
@@ -24,11 +26,9 @@ from ilcdlib.epd.dialect.itb import ItbIlcdXmlEpdReader
 from ilcdlib.epd.dialect.oekobaudat import OekobauDatIlcdXmlEpdReader
 from ilcdlib.epd.reader import IlcdEpdReader
 
-
-class DeclarationReaderFactory:
-    """Factory for creating EPD readers."""
-
-    __DIALECTS: dict[str, Type[IlcdEpdReader]] = {
+# Keys must be lowercase: lookups lowercase the requested dialect once and use a single dict access.
+_DIALECTS: Mapping[str, Type[IlcdEpdReader]] = MappingProxyType(
+    {
         "environdec": EnvirondecIlcdXmlEpdReader,
         "indata": IndataIlcdXmlEpdReader,
         "oekobau.dat": OekobauDatIlcdXmlEpdReader,
@@ -38,15 +38,44 @@ class DeclarationReaderFactory:
         "epdnorge": EpdNorgeIlcdXmlEpdReader,
         "epddenmark": EpdDenmarkIlcdXmlEpdReader,
     }
+)
+
+
+# Every URL signature with the dialect it identifies, dialects in declaration order.
+_URL_SIGNATURE_TABLE: tuple[tuple[str, Type[IlcdEpdReader], str], ...] = tuple(
+    (signature, reader_cls, name) for name, reader_cls in _DIALECTS.items() for signature in reader_cls.URL_SIGNATURES
+)
+# Dialects which recognize URLs by their own `is_known_url` rather than by signatures.
+_CUSTOM_URL_CHECK_DIALECTS: tuple[tuple[str, Type[IlcdEpdReader]], ...] = tuple(
+    (name, reader_cls) for name, reader_cls in _DIALECTS.items() if reader_cls.CUSTOM_URL_CHECK
+)
+
+
+def _map_url_signatures() -> dict[str, tuple[Type[IlcdEpdReader], str]]:
+    """Map URL signatures to the dialect they select, the first declared dialect wins a shared signature."""
+    result: dict[str, tuple[Type[IlcdEpdReader], str]] = {}
+    for signature, reader_cls, name in _URL_SIGNATURE_TABLE:
+        result.setdefault(signature, (reader_cls, name))
+    return result
+
+
+_MATCH_TO_DIALECT = _map_url_signatures()
+# Longer signatures go first, so a signature never loses to its own prefix found at the same position.
+_URL_DISPATCH = re.compile("|".join(re.escape(x) for x in sorted(_MATCH_TO_DIALECT, key=len, reverse=True)))
+
+
+class DeclarationReaderFactory:
+    """Factory for creating EPD readers."""
+
     DEFAULT_READER_CLASS = IlcdEpdReader
 
     def get_supported_dialects(self) -> list[str]:
         """Return a list of supported dialects."""
-        return list(self.__DIALECTS.keys())
+        return list(_DIALECTS.keys())
 
     def is_dialect_supported(self, dialect: str):
         """Return `True` if the dialect is supported, `False` otherwise."""
-        return dialect.lower() in self.__DIALECTS
+        return dialect.lower() in _DIALECTS
 
     def get_reader_class_or_default(self, dialect: str | None) -> Type[IlcdEpdReader]:
         """
@@ -56,10 +85,7 @@ class DeclarationReaderFactory:
         """
         if dialect is None:
             return self.DEFAULT_READER_CLASS
-        dialect = dialect.lower()
-        if dialect not in self.__DIALECTS:
-            return self.DEFAULT_READER_CLASS
-        return self.__DIALECTS[dialect]
+        return _DIALECTS.get(dialect.lower(), self.DEFAULT_READER_CLASS)
 
     def get_reader_class(self, dialect: str | None) -> Type[IlcdEpdReader]:
         """
@@ -71,9 +97,10 @@ class DeclarationReaderFactory:
         if dialect is None:
             return self.DEFAULT_READER_CLASS
         dialect = dialect.lower()
-        if dialect not in self.__DIALECTS:
+        reader_cls = _DIALECTS.get(dialect)
+        if reader_cls is None:
             raise ValueError(f"Unknown dialect: {dialect}.")
-        return self.__DIALECTS[dialect]
+        return reader_cls
 
     def autodiscover_by_url(self, url: str) -> tuple[Type[IlcdEpdReader], str]:
         """
@@ -84,9 +111,13 @@ class DeclarationReaderFactory:
         @:return tuple of reader class and dialect name
         """
         if url.startswith("http"):
-            for name, cls in self.__DIALECTS.items():
-                if cls.is_known_url(url):
-                    return cls, name
+            for name, reader_cls in _CUSTOM_URL_CHECK_DIALECTS:
+                if reader_cls.is_known_url(url):
+                    return reader_cls, name
+            # Signatures are lowercase, the dialect whose signature occurs first in the URL is selected
+            match = _URL_DISPATCH.search(url.lower())
+            if match is not None:
+                return _MATCH_TO_DIALECT[match.group()]
         return self.DEFAULT_READER_CLASS, "default"
 
 
@@ -14,8 +14,10 @@
 #  limitations under the License.
 #
 import datetime
+import functools
 import itertools
 import logging
+from types import MappingProxyType
 from typing import IO, Mapping, MutableMapping, Type, cast
 
 from openepd.model.common import Amount, Measurement
@@ -30,6 +32,7 @@ from openepd.model.validation.quantity import AmountMass
 
 from ilcdlib import const
 from ilcdlib.common import (
+    DEFAULT_XML_NS,
     BaseIlcdMediumSpecificReader,
     IlcdXmlReader,
     OpenEpdDeclarationSupportReader,
@@ -68,6 +71,7 @@ from ilcdlib.utils import (
     parse_unit_str,
     provider_domain_name_from_url,
 )
+from ilcdlib.xml_parser import T_ET, compile_xpath
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -75,6 +79,20 @@ _LOGGER = logging.getLogger(__name__)
 class IlcdEpdReader(OpenEpdDeclarationSupportReader, IlcdXmlReader):
     """Reader for ILCD+EPD datasets."""
 
+    # Lowercase URL fragments identifying the dialect, see `is_known_url`.
+    URL_SIGNATURES: tuple[str, ...] = ()
+    # Set by dialects which override `is_known_url`, URL autodiscovery then calls it instead of matching signatures.
+    CUSTOM_URL_CHECK: bool = False
+    # Namespaces forced by the dialect. They are applied after the document namespaces are remapped.
+    XML_NS_EXTRA: Mapping[str, str] = MappingProxyType({})
+    _TAG_COMMON_CLASS = f"{{{DEFAULT_XML_NS['common']}}}class"
+    _XP_PRODUCT_NAME_LANGS = compile_xpath(
+        "process:processInformation/process:dataSetInformation/process:name/process:baseName/@xml:lang", DEFAULT_XML_NS
+    )
+    _XP_EXCHANGE_BY_INTERNAL_ID = compile_xpath(
+        "process:exchanges/process:exchange[@dataSetInternalID=$internal_id]", DEFAULT_XML_NS
+    )
+
     def __init__(
         self,
         epd_process_id: str | None,
@@ -113,6 +131,8 @@ class IlcdEpdReader(OpenEpdDeclarationSupportReader, IlcdXmlReader):
             entity_type, entity_id, entity_version, entity_uri=entity_uri, allow_static_datasets=False
         )
         self.remap_xml_ns(self.epd_el_tree.nsmap)  # type: ignore
+        if self.XML_NS_EXTRA:
+            self.xml_parser.xml_ns.update(self.XML_NS_EXTRA)
         self.post_init()
 
     def post_init(self):
@@ -125,22 +145,18 @@ class IlcdEpdReader(OpenEpdDeclarationSupportReader, IlcdXmlReader):
 
     def get_supported_langs(self) -> list[str]:
         """Return the list of supported languages."""
-        result: list[str] = []
-        elements = self._get_all_els(
-            self.epd_el_tree,
-            ("process:processInformation", "process:dataSetInformation", "process:name", "process:baseName"),
-        )
-        for x in elements:
-            if x.attrib and x.attrib.get(self._LANG_ATTRIB_NAME):
-                result.append(none_throws(x.attrib.get(self._LANG_ATTRIB_NAME)))
-        return result
+        return list(self._supported_langs)
+
+    @functools.cached_property
+    def _supported_langs(self) -> tuple[str, ...]:
+        """Languages of the product name, the document doesn't change so they are collected once."""
+        return tuple(x for x in self._XP_PRODUCT_NAME_LANGS(self.epd_el_tree) if x)
 
     def get_lang_code(self, lang: LangDef) -> str | None:
         """Return the language of the PDF."""
-        lang_code = lang if isinstance(lang, str) else None
-        if not isinstance(lang, str) and lang is not None:
-            lang_code = lang[0] if len(lang) > 0 else None
-        return lang_code
+        if lang is None or isinstance(lang, str):
+            return lang
+        return lang[0] if len(lang) > 0 else None
 
     def get_own_reference(self) -> IlcdReference | None:
         """Get the reference to this data set."""
@@ -161,15 +177,15 @@ class IlcdEpdReader(OpenEpdDeclarationSupportReader, IlcdXmlReader):
             ("process:administrativeInformation", "process:publicationAndOwnership", "common:dataSetVersion"),
         )
 
+    @functools.cached_property
+    def _lci_method(self) -> T_ET.Element | None:
+        """LCI method and allocation section, which holds both the dataset type and the EPD subtype."""
+        return self._get_el(self.epd_el_tree, ("process:modellingAndValidation", "process:LCIMethodAndAllocation"))
+
     def is_epd(self) -> bool:
         """Return True if the dataset represents an EPD."""
-        return (
-            self._get_text(
-                self.epd_el_tree,
-                ("process:modellingAndValidation", "process:LCIMethodAndAllocation", "process:typeOfDataSet"),
-            )
-            == "EPD"
-        )
+        lci_method = self._lci_method
+        return lci_method is not None and self._get_text(lci_method, ("process:typeOfDataSet",)) == "EPD"
 
     def get_url_attachment(self, lang: LangDef) -> str | None:
         """Return URL attachment if exists."""
@@ -177,10 +193,8 @@ class IlcdEpdReader(OpenEpdDeclarationSupportReader, IlcdXmlReader):
 
     def get_dataset_type(self) -> str | None:
         """Return the ILCD dataset type. e.g. 'average dataset', 'industry dataset', 'generic dataset', etc."""
-        return self._get_text(
-            self.epd_el_tree,
-            ("process:modellingAndValidation", "process:LCIMethodAndAllocation", "common:other", "epd2013:subType"),
-        )
+        lci_method = self._lci_method
+        return self._get_text(lci_method, ("common:other", "epd2013:subType")) if lci_method is not None else None
 
     def is_product_epd(self) -> bool:
         """Return True if the dataset represents a Product EPD."""
@@ -195,7 +209,7 @@ class IlcdEpdReader(OpenEpdDeclarationSupportReader, IlcdXmlReader):
         return self.get_dataset_type() == "generic dataset"
 
     def get_epd_document_stream(self) -> IO[bytes] | None:
-        """Extract the EPD document."""
+        """Extract the EPD document. The caller must close the returned stream."""
         return self._get_external_binary(
             self.epd_el_tree,
             (
@@ -239,12 +253,17 @@ class IlcdEpdReader(OpenEpdDeclarationSupportReader, IlcdXmlReader):
         """Return the product description in the given language."""
         return self.get_general_comment(lang)
 
-    def get_date_published(self) -> datetime.date | None:
-        """Return the date the EPD was published."""
-        pub_date = self._get_date(
+    @functools.cached_property
+    def _publication_date(self) -> datetime.date | None:
+        """Publication date of the EPD as stated in the dataset, used for both publication and validity dates."""
+        return self._get_date(
             self.epd_el_tree,
             ("process:processInformation", "process:time", "common:other", "epd2019:publicationDateOfEPD"),
         )
+
+    def get_date_published(self) -> datetime.date | None:
+        """Return the date the EPD was published."""
+        pub_date = self._publication_date
         if pub_date is None:
             ref_year = self._get_int(
                 self.epd_el_tree,
@@ -260,11 +279,7 @@ class IlcdEpdReader(OpenEpdDeclarationSupportReader, IlcdXmlReader):
 
     def get_validity_ends_date(self) -> datetime.date | None:
         """Return the date the EPD is valid until."""
-
-        pub_date = self._get_date(
-            self.epd_el_tree,
-            ("process:processInformation", "process:time", "common:other", "epd2019:publicationDateOfEPD"),
-        )
+        pub_date = self._publication_date
         valid_until_year = self._get_int(
             self.epd_el_tree,
             (
@@ -515,7 +530,9 @@ class IlcdEpdReader(OpenEpdDeclarationSupportReader, IlcdXmlReader):
         for cl in classifications:
             classification_name = cl.attrib.get("name", "unknown") if cl.attrib else "unknown"
             classes = result[classification_name] = []
-            for x in self._get_all_els(cl, ("common:class",)):
+            for x in cl:
+                if x.tag != self._TAG_COMMON_CLASS:
+                    continue
                 cls_id = x.attrib.get("classId") if x.attrib and x.attrib.get("classId") else None
                 cls_name = x.text if x.text else None
                 classes.append(ProductClassDef(cls_id, cls_name))
@@ -550,33 +567,38 @@ class IlcdEpdReader(OpenEpdDeclarationSupportReader, IlcdXmlReader):
         reference_flow_properties = none_throws(exchange_dto.flow_dataset_reader).get_flow_other_properties(
             include_ref_flow_prop
         )
+        exchange_mean_value = exchange_dto.mean_value or 1.0
         result = {}
         for rfp in reference_flow_properties:
-            unit_group_reader = rfp.dataset_reader.get_unit_group_reader()
-            unit = unit_group_reader.get_reference_unit() if unit_group_reader is not None else None
+            dataset_reader = rfp.dataset_reader
+            unit_group_reader = dataset_reader.get_unit_group_reader()
+            if unit_group_reader is None:
+                continue
+            unit = unit_group_reader.get_reference_unit()
             if unit is None:
                 continue
-            amount = (exchange_dto.mean_value or 1.0) * (rfp.mean_value or 1.0) * unit.mean_value
-            prop_name = rfp.dataset_reader.get_name(["en", None])
+            prop_name = dataset_reader.get_name(("en", None))
             if prop_name is None:
                 continue
-            result[prop_name.lower()] = Measurement(mean=amount, unit=unit.name)
+            amount = exchange_mean_value * (rfp.mean_value or 1.0) * unit.mean_value
+            # Values are already floats and unit names strings, validation would only copy them.
+            result[prop_name.lower()] = Measurement.construct(mean=amount, unit=unit.name)
         return result
 
     def get_product_flow(self) -> IlcdExchangeDto | None:
         """Return the product flow (includes mean value and ilcd flow reader)."""
+        return self._product_flow
+
+    @functools.cached_property
+    def _product_flow(self) -> IlcdExchangeDto | None:
+        """Product flow, resolved once since declared unit, material and flow properties all start from it."""
         ref_id = self.get_ref_to_product_flow_dataset()
         if ref_id is None:
             return None
-        exchange_element = self._get_el(
-            self.epd_el_tree,
-            (
-                "process:exchanges",
-                f"process:exchange[@dataSetInternalID='{ref_id}']",
-            ),
-        )
-        if exchange_element is None:
+        exchange_elements = self._XP_EXCHANGE_BY_INTERNAL_ID(self.epd_el_tree, internal_id=str(ref_id))
+        if not exchange_elements:
             return None
+        exchange_element = exchange_elements[0]
         flow_dataset_el = self._get_external_tree(exchange_element, ("process:referenceToFlowDataSet",))
         if flow_dataset_el is None:
             return None
@@ -626,7 +648,7 @@ class IlcdEpdReader(OpenEpdDeclarationSupportReader, IlcdXmlReader):
         if unit is None:
             return None
         amount = (exchange_dto.mean_value or 1.0) * (reference_flow_property.mean_value or 1.0) * unit.mean_value
-        return Amount(qty=amount, unit=unit.name)
+        return Amount.construct(qty=amount, unit=unit.name)
 
     def get_program_operator_id(self) -> str | None:
         """Get document identifier assigned by program operator."""
@@ -701,11 +723,21 @@ class IlcdEpdReader(OpenEpdDeclarationSupportReader, IlcdXmlReader):
         result: dict[str, str] = {}
         for classification_name, class_defs in classes.items():
             if len(class_defs) > 0:
-                result[classification_name] = (
-                    (class_defs[-1].id or "") + " " + " / ".join([none_throws(x.name) for x in class_defs])
-                ).strip()
+                key, value = self._product_class_to_openepd(classification_name, class_defs)
+                result[key] = value
         return result
 
+    def _product_class_to_openepd(self, classification_name: str, class_defs: list[ProductClassDef]) -> tuple[str, str]:
+        """
+        Convert non-empty class hierarchy of a single classification to OpenEPD key and value.
+
+        It could be overriden by dialects which use a specific format for their classification.
+        """
+        return (
+            classification_name,
+            ((class_defs[-1].id or "") + " " + " / ".join([none_throws(x.name) for x in class_defs])).strip(),
+        )
+
     def _get_mapped_categories(self, product_classes: Mapping[str, str]) -> list[MappedCategory]:
         candidates: list[MappedCategory] = []
         for classification_name, class_name in product_classes.items():
@@ -735,12 +767,12 @@ class IlcdEpdReader(OpenEpdDeclarationSupportReader, IlcdXmlReader):
         if provider_domain is None:
             provider_domain = provider_domain_name_from_url(base_url)
         lang_code = self.get_lang_code(lang)
-        manufacturer_reader = self.get_manufacturer_reader()
-        manufacturer = (
-            manufacturer_reader.to_openepd_org(lang, base_url, provider_domain) if manufacturer_reader else None
-        )
-        publisher_reader = self.get_publisher_reader()
-        publisher = publisher_reader.to_openepd_org(lang, base_url, provider_domain) if publisher_reader else None
+
+        def to_org(contact_reader: IlcdContactReader | None) -> OpenEpdIlcdOrg | None:
+            return contact_reader.to_openepd_org(lang, base_url, provider_domain) if contact_reader else None
+
+        manufacturer = to_org(self.get_manufacturer_reader())
+        publisher = to_org(self.get_publisher_reader())
         program_operator_reader = self.get_program_operator_reader()
         program_operator = self.get_program_operator(program_operator_reader, lang, base_url, provider_domain)
         declared_unit = self.get_declared_unit()
@@ -843,10 +875,11 @@ class IlcdEpdReader(OpenEpdDeclarationSupportReader, IlcdXmlReader):
         """
         Return whether the URL recognized by this particular reader.
 
-        This method should be overriden by the dialect and return true if the input URL is know url for this dialect.
+        Dialects declare lowercase URL fragments they are recognized by in `URL_SIGNATURES`. Dialects which need other
+        rules may override this method instead and set `CUSTOM_URL_CHECK`, so URL autodiscovery calls the override.
         """
-
-        return False
+        normalized_url = url.lower()
+        return any(signature in normalized_url for signature in cls.URL_SIGNATURES)
 
     @classmethod
     def _create_category_mapper(cls, classification_name: str) -> CsvCategoryMapper | None:
@@ -863,9 +896,12 @@ class IlcdEpdReader(OpenEpdDeclarationSupportReader, IlcdXmlReader):
 
         It will either return a cached on a class-level instance or create a new one if it does not exist.
         """
-        if not hasattr(self.__class__, "_category_mapper"):
-            self.__class__._category_mappers = {}  # type: ignore[attr-defined]
-        mappers: dict[str, CategoryMapper] = self.__class__._category_mappers  # type: ignore[attr-defined]
+        cls = self.__class__
+        # Look up the class' own dictionary: dialects must not share the cache inherited from the base reader.
+        mappers: dict[str, CategoryMapper] | None = cls.__dict__.get("_category_mappers")
+        if mappers is None:
+            mappers = {}
+            cls._category_mappers = mappers  # type: ignore[attr-defined]
         if classification_name not in mappers:
             mapper: CategoryMapper | None = self._create_category_mapper(classification_name)
             if mapper is None:
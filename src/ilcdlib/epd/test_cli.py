@@ -0,0 +1,47 @@
+#
+#  Copyright 2024 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+from unittest import TestCase
+
+from ilcdlib.epd.cli import extract_base_url
+
+
+class ExtractBaseUrlTestCase(TestCase):
+    def test_extract_base_url(self):
+        self.assertEqual(
+            extract_base_url("https://oekobaudat.de/OEKOBAU.DAT/datasetdetail/process.xhtml?uuid=ee8863aa"),
+            "https://oekobaudat.de/OEKOBAU.DAT",
+        )
+        self.assertEqual(
+            extract_base_url("https://node.example.com/resource/processes/ee8863aa?version=00.00.018"),
+            "https://node.example.com",
+        )
+        self.assertEqual(
+            extract_base_url("https://data.environdec.com/showProcess.xhtml?uuid=bfeb8678"),
+            "https://data.environdec.com",
+        )
+        self.assertIsNone(extract_base_url("https://node.example.com/processes/ee8863aa"))
+        self.assertIsNone(extract_base_url("test_data/resource/archive.zip"))
+
+    def test_extract_base_url_marker_priority(self):
+        # Dataset detail marker takes precedence even if resource path comes first
+        self.assertEqual(
+            extract_base_url("https://node.example.com/resource/datasetdetail/process.xhtml?uuid=ee8863aa"),
+            "https://node.example.com/resource",
+        )
+        self.assertEqual(
+            extract_base_url("https://node.example.com/showProcess.xhtml/resource/processes/ee8863aa"),
+            "https://node.example.com/showProcess.xhtml",
+        )
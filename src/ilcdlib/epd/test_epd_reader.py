@@ -18,8 +18,10 @@ import datetime
 from pathlib import Path
 from unittest import TestCase
 
+from ilcdlib.epd.dialect.environdec import EnvirondecIlcdXmlEpdReader
 from ilcdlib.epd.dialect.epditaly import EpdItalyIlcdXmlEpdReader
-from ilcdlib.epd.dialect.oekobaudat import OekobauDatIlcdXmlEpdReader
+from ilcdlib.epd.dialect.epdnorge import EpdNorgeIlcdXmlEpdReader
+from ilcdlib.epd.dialect.oekobaudat import OekobauDatCategoryMapper, OekobauDatIlcdXmlEpdReader
 from ilcdlib.epd.reader import IlcdEpdReader
 from ilcdlib.medium.archive import ZipIlcdReader
 
@@ -86,6 +88,16 @@ class OekobaudatTestCase(BaseEpdReaderTestCase):
             ZipIlcdReader(self.TEST_DATA_BASE / "ibu_with_dependencies.zip"),
         )
 
+    def test_category_mapper_cached_per_class(self):
+        mapper = self.epd_reader.get_category_mapper("oekobau.dat")
+        self.assertIsInstance(mapper, OekobauDatCategoryMapper)
+        self.assertIs(self.epd_reader.get_category_mapper("oekobau.dat"), mapper)
+        self.assertIsNot(IlcdEpdReader.__dict__.get("_category_mappers", {}).get("oekobau.dat"), mapper)
+
+    def test_oekobaudat_product_class(self):
+        product_classes = self.epd_reader._product_classes_to_openepd(self.epd_reader.get_product_classes())
+        self.assertEqual(product_classes["oekobau.dat"], "3.3.02 Parkett")
+
     def test_read_oekobaudat_fields_scenario(self):
         self.assertEqual(self.epd_reader.get_scenario_names(self.LANG), {"S1": "100% recycling", "S2": "Scenario 2"})
 
@@ -105,3 +117,74 @@ class EpdItalyTestCase(BaseEpdReaderTestCase):
             self.epd_reader.get_scenario_names(self.LANG),
             {"100% riciclo": "100% riciclo", "100% incenerimento": "100% incenerimento"},
         )
+
+
+class EnvirondecTestCase(BaseEpdReaderTestCase):
+    __test__ = True
+
+    def setUp(self):
+        self.epd_reader = EnvirondecIlcdXmlEpdReader(
+            None,
+            None,
+            ZipIlcdReader(self.TEST_DATA_BASE / "environdec_with_dependencies.zip"),
+        )
+
+    def test_read_environdec_dates(self):
+        self.assertEqual(self.epd_reader.get_date_published(), datetime.date(2020, 5, 6))
+        self.assertEqual(self.epd_reader.get_validity_ends_date(), datetime.date(2025, 4, 22))
+
+
+class EpdNorgeTestCase(BaseEpdReaderTestCase):
+    __test__ = True
+
+    def setUp(self):
+        self.epd_reader = EpdNorgeIlcdXmlEpdReader(
+            None,
+            None,
+            ZipIlcdReader(self.TEST_DATA_BASE / "epdnorge_with_dependencies.zip"),
+        )
+
+    def test_read_epdnorge_dates(self):
+        self.assertEqual(self.epd_reader.get_date_published(), datetime.date(2022, 3, 18))
+        self.assertEqual(self.epd_reader.get_validity_ends_date(), datetime.date(2027, 3, 18))
+
+    def test_read_epdnorge_fields(self):
+        self.assertEqual(
+            self.epd_reader.get_product_description(self.LANG),
+            "Extruded aluminium profiles for window and facade systems.",
+        )
+        self.assertEqual(self.epd_reader.get_data_entry_by(self.LANG).name, "Fjord LCA Consulting AS")
+        self.assertEqual(
+            self.epd_reader.get_pcr(self.LANG).name,
+            "NPCR 013:2021 Part B for Steel and Aluminium Construction Products",
+        )
+        validations = self.epd_reader.get_ilcd_validations(self.LANG)
+        self.assertEqual(self.epd_reader.get_third_party_verifier(validations).name, "Kari Nordmann")
+
+    def test_generic_reader_differs(self):
+        generic_reader = IlcdEpdReader(None, None, self.epd_reader.data_provider)
+        self.assertEqual(generic_reader.get_date_published(), datetime.date(2021, 1, 1))
+        self.assertEqual(generic_reader.get_validity_ends_date(), datetime.date(2027, 1, 1))
+        self.assertIsNone(generic_reader.get_product_description(self.LANG))
+        self.assertEqual(generic_reader.get_data_entry_by(self.LANG).name, "EPD-Norge")
+        self.assertEqual(
+            generic_reader.get_pcr(self.LANG).name,
+            "NPCR 013:2021 Part B for Steel and Aluminium Construction Products "
+            "This also applies for inorganic coatings",
+        )
+        validations = generic_reader.get_ilcd_validations(self.LANG)
+        self.assertEqual(generic_reader.get_third_party_verifier(validations).name, "Norsk Verifisering AS")
+
+    def test_epdnorge_to_openepd(self):
+        declaration = self.epd_reader.to_openepd_declaration(self.LANG)
+        self.assertEqual(declaration.date_of_issue.date(), datetime.date(2022, 3, 18))
+        self.assertEqual(declaration.valid_until.date(), datetime.date(2027, 3, 18))
+        self.assertEqual(declaration.third_party_verifier.name, "Kari Nordmann")
+        self.assertEqual(declaration.pcr.name, "NPCR 013:2021 Part B for Steel and Aluminium Construction Products")
+
+    def test_epdnorge_category_mapping(self):
+        product_classes = self.epd_reader._product_classes_to_openepd(self.epd_reader.get_product_classes())
+        self.assertEqual(
+            [x.openepd_category_id for x in self.epd_reader._get_mapped_categories(product_classes)],
+            ["Aluminium", "Steel"],
+        )
@@ -0,0 +1,68 @@
+#
+#  Copyright 2024 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+from unittest import TestCase
+from unittest.mock import patch
+
+from ilcdlib.epd import factory
+from ilcdlib.epd.dialect.environdec import EnvirondecIlcdXmlEpdReader
+from ilcdlib.epd.dialect.epdnorge import EpdNorgeIlcdXmlEpdReader
+from ilcdlib.epd.factory import DeclarationReaderFactory
+from ilcdlib.epd.reader import IlcdEpdReader
+
+
+class CustomUrlIlcdXmlEpdReader(IlcdEpdReader):
+    CUSTOM_URL_CHECK = True
+
+    @classmethod
+    def is_known_url(cls, url: str) -> bool:
+        return url.lower().startswith("https://custom.example.com/")
+
+
+class DeclarationReaderFactoryTestCase(TestCase):
+    def setUp(self):
+        self.factory = DeclarationReaderFactory()
+
+    def test_autodiscover_by_url(self):
+        self.assertEqual(
+            self.factory.autodiscover_by_url("https://data.Environdec.com/resource/processes/1"),
+            (EnvirondecIlcdXmlEpdReader, "environdec"),
+        )
+        self.assertEqual(
+            self.factory.autodiscover_by_url("https://epdnorway.lca-data.com/resource/processes/1"),
+            (EpdNorgeIlcdXmlEpdReader, "epdnorge"),
+        )
+        self.assertEqual(
+            self.factory.autodiscover_by_url("https://example.com/resource/processes/1"), (IlcdEpdReader, "default")
+        )
+        self.assertEqual(self.factory.autodiscover_by_url("environdec.zip"), (IlcdEpdReader, "default"))
+
+    def test_autodiscover_by_url_first_signature_in_url_wins(self):
+        self.assertEqual(
+            self.factory.autodiscover_by_url("https://epdnorway.lca-data.com/resource/itb/1"),
+            (EpdNorgeIlcdXmlEpdReader, "epdnorge"),
+        )
+
+    def test_autodiscover_by_url_calls_overridden_is_known_url(self):
+        dialects = (("custom", CustomUrlIlcdXmlEpdReader),)
+        with patch.object(factory, "_CUSTOM_URL_CHECK_DIALECTS", dialects):
+            self.assertEqual(
+                self.factory.autodiscover_by_url("https://custom.example.com/environdec/1"),
+                (CustomUrlIlcdXmlEpdReader, "custom"),
+            )
+            self.assertEqual(
+                self.factory.autodiscover_by_url("https://data.environdec.com/resource/processes/1"),
+                (EnvirondecIlcdXmlEpdReader, "environdec"),
+            )
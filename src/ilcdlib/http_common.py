@@ -16,6 +16,7 @@
 import abc
 from contextlib import contextmanager
 import datetime
+import io
 from io import BytesIO
 import threading
 from time import sleep
@@ -23,12 +24,50 @@ from urllib.parse import quote
 
 import requests
 from requests.adapters import HTTPAdapter
-from urllib3 import Retry
+from urllib3 import HTTPResponse, Retry
 
 from ilcdlib.utils import no_trailing_slash
 from ilcdlib.xml_parser import T_ET, XmlParser
 
 
+class HttpResponseStream(io.RawIOBase):
+    """
+    Binary stream reading the body of an HTTP response straight from the connection.
+
+    The body is not loaded into memory, so the stream is not seekable and can be read only once. It must be closed
+    by the caller, preferably with a `with` block, closing it releases the connection.
+    """
+
+    def __init__(self, response: HTTPResponse) -> None:
+        """
+        Create new stream over the response body.
+
+        :param response: response requested with `preload_content=False`.
+        """
+        super().__init__()
+        self._response = response
+
+    @classmethod
+    def open(cls, response: HTTPResponse) -> io.BufferedReader:
+        """Wrap the response body into a buffered stream."""
+        return io.BufferedReader(cls(response))
+
+    def readable(self) -> bool:
+        """Return True, the stream is readable."""
+        return True
+
+    def readinto(self, buffer) -> int:
+        """Read the body into the given buffer and return the number of bytes read."""
+        return self._response.readinto(buffer)
+
+    def close(self) -> None:
+        """Close the stream and release the connection."""
+        if not self.closed:
+            self._response.close()
+            self._response.release_conn()
+        super().close()
+
+
 class Throttler:
     """Limit the number of calls to the code inside the context manager per second."""
 
@@ -13,14 +13,17 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
+import io
 from os import PathLike
+import shutil
 from typing import IO, Literal, Sequence, TextIO, overload
 from zipfile import Path as ZipPath
-from zipfile import ZipFile
+from zipfile import ZipFile, ZipInfo
 
 from ilcdlib.common import BaseIlcdMediumSpecificReader
 from ilcdlib.const import IlcdDatasetType
 from ilcdlib.dto import IlcdReference
+from ilcdlib.xml_parser import T_ET
 
 
 class ZipIlcdReader(BaseIlcdMediumSpecificReader):
@@ -39,6 +42,9 @@ class ZipIlcdReader(BaseIlcdMediumSpecificReader):
         IlcdDatasetType.FlowProperty: "flowproperties",
     }
 
+    READ_BUFFER_SIZE = 64 * 1024
+    """Buffer size for binary entity streams, lets XML parsers consume inflated data in large chunks."""
+
     def __init__(self, zip_file: PathLike | IO[bytes]):
         try:
             self._zip_file = ZipFile(zip_file, "r")
@@ -47,6 +53,25 @@ class ZipIlcdReader(BaseIlcdMediumSpecificReader):
         self.__ilcd_dir = ZipPath(self._zip_file) / "ILCD"
         if not self.__ilcd_dir.is_dir():
             raise ValueError("Could not find ILCD directory in the archive root. Is it really an ILCD archive?")
+        self.__members: dict[str, ZipInfo] = {x.filename: x for x in self._zip_file.infolist()}
+        self.__entity_index = self.__build_entity_index()
+        self.__xml_tree_cache: dict[tuple[str, str, str | None], T_ET.Element] = {}
+
+    @property
+    def xml_tree_cache(self) -> dict[tuple[str, str, str | None], T_ET.Element] | None:
+        """Return the storage for XML trees parsed from this archive, archive content never changes."""
+        return self.__xml_tree_cache
+
+    def __build_entity_index(self) -> dict[tuple[str, str], ZipInfo]:
+        """Map (folder, entity id) to the first xml file of this entity in the archive."""
+        index: dict[tuple[str, str], ZipInfo] = {}
+        for name, info in self.__members.items():
+            parts = name.split("/")
+            if len(parts) != 3 or parts[0] != "ILCD" or not parts[2].endswith(".xml"):
+                continue
+            entity_id = parts[2].removesuffix(".xml").split("_")[0]
+            index.setdefault((parts[1], entity_id), info)
+        return index
 
     @overload
     def get_entity_stream(
@@ -74,10 +99,12 @@ class ZipIlcdReader(BaseIlcdMediumSpecificReader):
         :param binary: If True, the stream is opened in binary mode, otherwise in text mode.
         :raise: ValueError if the entity does not exist.
         """
-        full_path = self.__resolve_entity_path(entity_type, entity_id, entity_version)
-        if full_path is None or not full_path.exists():
+        info = self.__resolve_entity_info(entity_type, entity_id, entity_version)
+        if info is None:
             raise ValueError(f"Could not find entity {entity_type} {entity_id} (version {entity_version}).")
-        return full_path.open("rb" if binary else "r")  # type: ignore
+        if binary:
+            return io.BufferedReader(self._zip_file.open(info), buffer_size=self.READ_BUFFER_SIZE)  # type: ignore
+        return io.TextIOWrapper(self._zip_file.open(info))
 
     def get_binary_stream_by_name(self, name: str, entity_type: str | None = None) -> IO[bytes] | None:
         """
@@ -86,10 +113,10 @@ class ZipIlcdReader(BaseIlcdMediumSpecificReader):
         :param name: The name of the file.
         :param entity_type: The type of the entity. e.g. "process", "contact", "flow", etc.
         """
-        full_path = self.__ilcd_dir / "external_docs" / name
-        if not full_path.exists():
+        info = self.__members.get(f"ILCD/external_docs/{name}")
+        if info is None:
             return None
-        return full_path.open("rb")
+        return self._zip_file.open(info)
 
     def entity_exists(self, entity_type: str, entity_id: str, entity_version: str | None = None) -> bool:
         """
@@ -101,8 +128,7 @@ class ZipIlcdReader(BaseIlcdMediumSpecificReader):
         :param entity_id: The id of the entity, typically a GUID.
         :param entity_version: The version of the entity e.g. 12.34.56
         """
-        full_path = self.__get_file_path_for_entity(entity_type, entity_id, entity_version)
-        return full_path.exists()
+        return self.__get_member_name(entity_type, entity_id, entity_version) in self.__members
 
     def list_entities(self, entity_type: str) -> Sequence[IlcdReference]:
         """
@@ -127,27 +153,19 @@ class ZipIlcdReader(BaseIlcdMediumSpecificReader):
             if x.is_file() and x.name.endswith(".xml")
         ]
 
-    def __resolve_entity_path(
+    def __resolve_entity_info(
         self, entity_type: str, entity_id: str, entity_version: str | None = None
-    ) -> ZipPath | None:
-        if self.entity_exists(entity_type, entity_id, entity_version=entity_version):
-            return self.__get_file_path_for_entity(entity_type, entity_id, entity_version)
+    ) -> ZipInfo | None:
+        info = self.__members.get(self.__get_member_name(entity_type, entity_id, entity_version))
+        if info is not None:
+            return info
+        if isinstance(entity_type, IlcdDatasetType):
+            entity_type_str = self.DATASET_TO_FOLDER.get(entity_type, str(entity_type))
         else:
-            if isinstance(entity_type, IlcdDatasetType):
-                entity_type_str = self.DATASET_TO_FOLDER.get(entity_type, str(entity_type))
-            else:
-                entity_type_str = entity_type
-            type_dir = self.__ilcd_dir / entity_type_str
-            if not type_dir.is_dir():
-                return None
-            for x in type_dir.iterdir():
-                if x.is_file() and x.name.startswith(entity_id) and x.name.endswith(".xml"):
-                    return self.__get_file_path_for_entity(entity_type, x.name)
-        return None
-
-    def __get_file_path_for_entity(
-        self, entity_type: str, entity_id: str, entity_version: str | None = None
-    ) -> ZipPath:
+            entity_type_str = entity_type
+        return self.__entity_index.get((entity_type_str, entity_id))
+
+    def __get_member_name(self, entity_type: str, entity_id: str, entity_version: str | None = None) -> str:
         if isinstance(entity_type, IlcdDatasetType):
             entity_type = self.DATASET_TO_FOLDER.get(entity_type, str(entity_type))
         if entity_version is None and "." in entity_id:
@@ -156,8 +174,7 @@ class ZipIlcdReader(BaseIlcdMediumSpecificReader):
             file_name = f"{entity_id}_{entity_version}.xml"
         else:
             file_name = f"{entity_id}.xml"
-        full_path = self.__ilcd_dir / entity_type / file_name
-        return full_path
+        return f"ILCD/{entity_type}/{file_name}"
 
     def close(self):
         """
@@ -173,4 +190,4 @@ class ZipIlcdReader(BaseIlcdMediumSpecificReader):
             raise ValueError("Cannot save closed zip file.")
         with open(p, "wb") as f:
             self._zip_file.fp.seek(0)
-            f.write(self._zip_file.fp.read())
+            shutil.copyfileobj(self._zip_file.fp, f, self.READ_BUFFER_SIZE)
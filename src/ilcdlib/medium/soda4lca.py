@@ -22,6 +22,7 @@ import urllib3
 from urllib3.util import parse_url
 
 from ilcdlib.dto import IlcdReference
+from ilcdlib.http_common import HttpResponseStream
 from ilcdlib.medium.archive import ZipIlcdReader
 from ilcdlib.soda4lca.api_client import Soda4LcaXmlApiClient
 from ilcdlib.utils import none_throws
@@ -120,13 +121,18 @@ class Soda4LcaZipReader(ZipIlcdReader):
         return self._soda4lca_client.get_download_epd_document_link(self._ref.entity_id, self._ref.entity_version)
 
     def download_pdf(self) -> IO[bytes] | None:
-        """Download the associated PDF document if any."""
+        """
+        Download the associated PDF document if any.
+
+        The document is read directly from the connection, see `HttpResponseStream`. The caller must close the stream.
+        """
         url = self.get_pdf_url()
         if url is None:
             return None
-        response = http.request("GET", url)
+        response = http.request("GET", url, preload_content=False)
         if response.status == 200:
-            return io.BytesIO(response.data)
+            return HttpResponseStream.open(response)
+        response.release_conn()
         raise ValueError(f"Could not download PDF from {url}. Status code: {response.status}")
 
     def resolve_entity_url(self, ref: IlcdReference, digital_file: str | None) -> str | None:
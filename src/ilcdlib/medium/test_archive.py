@@ -13,9 +13,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import tempfile
 from unittest import TestCase
 
+from ilcdlib.common import IlcdXmlReader
 from ilcdlib.medium.archive import ZipIlcdReader
 
 
@@ -51,3 +54,30 @@ class ZipMediumTestCase(TestCase):
         reader = ZipIlcdReader(self.TEST_DATA_BASE / "environdec_with_dependencies.zip")
         with reader.get_entity_stream("external_docs", "EPD_logotype_stor_rgb.jpg", binary=True) as f:
             self.assertEqual(len(f.read()), 28859)
+
+    def test_read_entity_with_other_version(self):
+        reader = ZipIlcdReader(self.TEST_DATA_BASE / "environdec_with_dependencies.zip")
+        with reader.get_entity_stream("contacts", "9e4aaaf4-2af3-4c77-ac32-cb2ade909608", "99.99.999") as f:
+            self.assertEqual(len(f.read()), 1442)
+        with self.assertRaises(ValueError):
+            reader.get_entity_stream("contacts", "aaaaaaaa-2af3-4c77-ac32-cb2ade909608", "00.00.001")
+
+    def test_save_to(self):
+        source = self.TEST_DATA_BASE / "environdec_with_dependencies.zip"
+        reader = ZipIlcdReader(source)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target = Path(tmp_dir) / "copy.zip"
+            reader.save_to(target)
+            self.assertEqual(target.read_bytes(), source.read_bytes())
+
+    def test_parse_entity_from_threads(self):
+        reader = ZipIlcdReader(self.TEST_DATA_BASE / "environdec_with_dependencies.zip")
+        xml_reader = IlcdXmlReader(reader)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            trees = list(
+                executor.map(
+                    lambda _: xml_reader.get_xml_tree("contacts", "9e4aaaf4-2af3-4c77-ac32-cb2ade909608", "00.00.001"),
+                    range(8),
+                )
+            )
+        self.assertEqual(len({id(x) for x in trees}), 1)
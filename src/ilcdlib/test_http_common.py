@@ -0,0 +1,41 @@
+#
+#  Copyright 2024 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+import io
+from unittest import TestCase
+from unittest.mock import patch
+
+from urllib3 import HTTPResponse
+
+from ilcdlib.http_common import HttpResponseStream
+
+
+class HttpResponseStreamTestCase(TestCase):
+    def test_read_body(self):
+        response = HTTPResponse(body=io.BytesIO(b"%PDF-1.4 document"), preload_content=False)
+        with HttpResponseStream.open(response) as stream:
+            self.assertFalse(stream.seekable())
+            self.assertEqual(stream.read(4), b"%PDF")
+            self.assertEqual(stream.read(), b"-1.4 document")
+            self.assertEqual(stream.read(), b"")
+
+    def test_close_releases_connection(self):
+        response = HTTPResponse(body=io.BytesIO(b"%PDF-1.4 document"), preload_content=False)
+        with patch.object(response, "release_conn") as release_conn:
+            with HttpResponseStream.open(response) as stream:
+                stream.read(4)
+            release_conn.assert_called_once()
+        self.assertTrue(stream.closed)
+        self.assertTrue(response.closed)
@@ -0,0 +1,34 @@
+#
+#  Copyright 2024 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+import datetime
+from unittest import TestCase
+
+from ilcdlib.utils import parse_line_end_date
+
+
+class ParseLineEndDateTestCase(TestCase):
+    def test_date_at_line_end(self):
+        self.assertEqual(parse_line_end_date("Registration date: 2020-05-06 "), datetime.date(2020, 5, 6))
+        self.assertEqual(parse_line_end_date("2025-04-22"), datetime.date(2025, 4, 22))
+
+    def test_no_date_at_line_end(self):
+        self.assertIsNone(parse_line_end_date("Registration date: 2020-05-06, updated"))
+        self.assertIsNone(parse_line_end_date("Validity date: 2025-02-30"))
+        self.assertIsNone(parse_line_end_date(""))
+
+    def test_malformed_trailing_token(self):
+        self.assertIsNone(parse_line_end_date("Validity date: x12020-01-01"))
+        self.assertIsNone(parse_line_end_date("Validity date: 02025-01-01"))
@@ -0,0 +1,61 @@
+#
+#  Copyright 2024 by C Change Labs Inc. www.c-change-labs.com
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+from unittest import TestCase
+
+from ilcdlib.xml_parser import XmlParser
+
+DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<root xmlns:a="http://example.com/a" xmlns:b="http://example.com/b">
+   <a:item>first a</a:item>
+   <a:item>second a</a:item>
+   <b:item>b</b:item>
+   <a:name xml:lang="de">Name</a:name>
+   <a:name xml:lang="en">name</a:name>
+</root>
+"""
+
+
+class XmlParserTestCase(TestCase):
+    def setUp(self):
+        self.parser = XmlParser(ns_map={"x": "http://example.com/a"})
+        self.root = self.parser.get_xml_tree(DOCUMENT_XML.encode())
+
+    def test_get_el(self):
+        self.assertEqual(self.parser.get_el_text(self.root, "x:item"), "first a")
+        self.assertIsNone(self.parser.get_el(self.root, "x:missing"))
+        self.assertEqual([x.text for x in self.parser.get_all_els(self.root, "x:item")], ["first a", "second a"])
+
+    def test_get_el_after_namespace_change(self):
+        self.assertEqual(self.parser.get_el_text(self.root, "x:item"), "first a")
+        self.parser.xml_ns["x"] = "http://example.com/b"
+        self.assertEqual(self.parser.get_el_text(self.root, "x:item"), "b")
+
+    def test_get_el_after_namespace_update(self):
+        self.assertEqual(self.parser.get_el_text(self.root, "x:item"), "first a")
+        self.parser.xml_ns.update(x="http://example.com/b")
+        self.assertEqual(self.parser.get_el_text(self.root, "x:item"), "b")
+        del self.parser.xml_ns["x"]
+        self.parser.xml_ns.setdefault("x", "http://example.com/a")
+        self.assertEqual(self.parser.get_el_text(self.root, "x:item"), "first a")
+
+    def test_get_el_clark_notation(self):
+        self.assertEqual(self.parser.get_el_text(self.root, "{http://example.com/b}item"), "b")
+
+    def test_get_localized_el(self):
+        self.assertEqual(self.parser.get_localized_el(self.root, "x:name", "en").text, "name")
+        self.assertEqual(self.parser.get_localized_el(self.root, "x:name", None).text, "Name")
+        self.assertIsNone(self.parser.get_localized_el(self.root, "x:name", "fr"))
+        self.assertIsNone(self.parser.get_localized_el(self.root, "x:name", "e'n"))
@@ -27,6 +27,7 @@ from ilcdlib import const
 from ilcdlib.sanitizing.domain import domain_from_url
 
 PATTERN_WHITESPACE_SEQUENCE: Final[re.Pattern] = re.compile(r"\s+")
+PATTERN_ISO_DATE_AT_LINE_END: Final[re.Pattern] = re.compile(r"(?:^|\s)(\d{4}-\d{2}-\d{2})\s*$")
 LOGGER = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -79,6 +80,17 @@ def date_to_datetime(date: datetime.date | None, timezone: str = "UTC") -> datet
     return datetime.datetime(year=date.year, month=date.month, day=date.day, tzinfo=pytz.timezone(timezone))
 
 
+def parse_line_end_date(line: str) -> datetime.date | None:
+    """Return the ISO date (YYYY-MM-DD) the line ends with, or `None` if the last word of the line is not a date."""
+    match = PATTERN_ISO_DATE_AT_LINE_END.search(line)
+    if match is None:
+        return None
+    try:
+        return datetime.date.fromisoformat(match.group(1))
+    except ValueError:
+        return None
+
+
 def csv_header_to_idx(col_name: str, header: list[str], raise_when_not_found=True) -> int | None:
     """
     Return index of the column in CSV line by given column name (as specified in header line).
@@ -13,22 +13,137 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
-from typing import IO
+import functools
+import threading
+from typing import IO, Any, NamedTuple, Self, Union
 import xml.etree.ElementTree as T_ET
 
-try:
-    from lxml import etree as _lxml_ET
-except ImportError:
-    _lxml_ET = None  # type: ignore
+from lxml import etree as _lxml_ET
 
-ET = _lxml_ET if _lxml_ET is not None else T_ET
+ET = _lxml_ET
+
+_thread_local = threading.local()
+
+
+def _get_lxml_parser() -> "_lxml_ET.XMLParser":
+    """
+    Get lxml parser configured for ILCD documents.
+
+    Blank text between elements is dropped and ID collection is disabled to keep the tree small. Entities are not
+    resolved and network access is disabled, ILCD documents never rely on either. lxml parsers must not be shared
+    between threads, so one instance is kept per thread and reused by all readers.
+    """
+    parser = getattr(_thread_local, "parser", None)
+    if parser is None:
+        parser = _lxml_ET.XMLParser(
+            huge_tree=False, remove_blank_text=True, resolve_entities=False, collect_ids=False, no_network=True
+        )
+        _thread_local.parser = parser
+    return parser
+
+
+XPathLike = Union[str, "_lxml_ET.XPath"]
+
+
+def compile_xpath(xpath: str, ns_map: dict[str, str]) -> "_lxml_ET.XPath":
+    """
+    Compile the given xpath expression once, so it can be evaluated many times without re-parsing.
+
+    Compiled expressions can be passed to `XmlParser` methods instead of strings.
+    """
+    return _lxml_ET.XPath(xpath, namespaces=ns_map, smart_strings=False)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_path(xpath: str, ns_items: tuple[tuple[str, str], ...]) -> "_lxml_ET.XPath | None":
+    """
+    Compile path expression for the given namespaces, shared by all parsers with the same namespace map.
+
+    Return None if the path is understood only by ElementPath, e.g. uses Clark notation, so `find` has to be used.
+    """
+    try:
+        return compile_xpath(xpath, dict(ns_items))
+    except (_lxml_ET.XPathSyntaxError, TypeError):
+        return None
+
+
+class LocalizedXPath(NamedTuple):
+    """Compiled expressions locating a localized element either in the given language or regardless of it."""
+
+    by_lang: "_lxml_ET.XPath"
+    first: "_lxml_ET.XPath"
+
+
+def compile_localized_xpath(xpath: str, ns_map: dict[str, str]) -> LocalizedXPath:
+    """
+    Compile the given xpath expression pointing to a multi-language element, e.g. `common:name`.
+
+    Result can be passed to `_get_localized_text` of ILCD readers instead of a path.
+    """
+    return LocalizedXPath(
+        by_lang=compile_xpath(f"{xpath}[@xml:lang=$lang]", ns_map),
+        first=compile_xpath(f"{xpath}[1]", ns_map),
+    )
+
+
+class _NamespaceMap(dict[str, str]):
+    """Namespace map which keeps the key of compiled paths and drops it whenever the map is changed."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__key: tuple[tuple[str, str], ...] | None = None
+
+    @property
+    def key(self) -> tuple[tuple[str, str], ...]:
+        """Return the key compiled paths are cached by, it is computed once per change of the map."""
+        if self.__key is None:
+            self.__key = tuple(self.items())
+        return self.__key
+
+    def __setitem__(self, prefix: str, uri: str) -> None:
+        self.__key = None
+        super().__setitem__(prefix, uri)
+
+    def __delitem__(self, prefix: str) -> None:
+        self.__key = None
+        super().__delitem__(prefix)
+
+    # typeshed declares dict `|=` through overloads of `|`, no override signature satisfies both
+    def __ior__(self, other: Any) -> Self:  # type: ignore[override,misc]
+        self.__key = None
+        return super().__ior__(other)
+
+    def update(self, *args, **kwargs) -> None:
+        """Update the map, see `dict.update`."""
+        self.__key = None
+        super().update(*args, **kwargs)
+
+    def setdefault(self, prefix: str, uri: str) -> str:
+        """Set the prefix if it is not in the map yet, see `dict.setdefault`."""
+        self.__key = None
+        return super().setdefault(prefix, uri)
+
+    def pop(self, prefix: str, *args):
+        """Remove the prefix from the map, see `dict.pop`."""
+        self.__key = None
+        return super().pop(prefix, *args)
+
+    def popitem(self) -> tuple[str, str]:
+        """Remove the last added prefix from the map, see `dict.popitem`."""
+        self.__key = None
+        return super().popitem()
+
+    def clear(self) -> None:
+        """Remove all prefixes from the map."""
+        self.__key = None
+        super().clear()
 
 
 class XmlParser(object):
     """Entry point to Element tree interface + a few utility functions."""
 
     def __init__(self, ns_map: dict[str, str] | None = None):
-        self.__xml_ns = ns_map or {}
+        self.__xml_ns = _NamespaceMap(ns_map or {})
 
     @property
     def xml_ns(self) -> dict[str, str]:
@@ -38,25 +153,62 @@ class XmlParser(object):
     def get_xml_tree(self, file_stream_or_str: IO | str | bytes) -> T_ET.Element:
         """Get the XML tree from a file stream or string."""
         if isinstance(file_stream_or_str, (str, bytes)):
-            return ET.fromstring(file_stream_or_str)
+            return _lxml_ET.fromstring(file_stream_or_str, _get_lxml_parser())
         else:
-            return ET.parse(file_stream_or_str).getroot()
+            return _lxml_ET.parse(file_stream_or_str, _get_lxml_parser()).getroot()
 
-    def get_el_text(self, parent: T_ET.Element, xpath: str, default_val: str | None = None) -> str | None:
+    def get_el_text(self, parent: T_ET.Element, xpath: XPathLike, default_val: str | None = None) -> str | None:
         """Get the text of an element."""
-        el = parent.find(xpath, self.xml_ns)
+        el = self.get_el(parent, xpath)
         if el is None:
             return default_val
         return el.text
 
-    def get_el(self, parent: T_ET.Element, xpath: str) -> T_ET.Element | None:
+    def get_el(self, parent: T_ET.Element, xpath: XPathLike) -> T_ET.Element | None:
         """Get an xml element by xpath."""
+        if isinstance(xpath, str):
+            xpath = self._compile_if_possible(parent, xpath)
+        if not isinstance(xpath, str):
+            found = xpath(parent)
+            return found[0] if found else None
         el = parent.find(xpath, self.xml_ns)
         if el is None:
             return None
         return el
 
-    def get_all_els(self, parent: T_ET.Element, xpath: str) -> list[T_ET.Element]:
+    def get_localized_el(self, parent: T_ET.Element, xpath: str, lang: str | None) -> T_ET.Element | None:
+        """
+        Get an xml element by xpath in the given language, or the first matching one if language is `None`.
+
+        The language is passed to compiled XPath as a variable, so one expression serves all languages.
+        """
+        if lang is None:
+            return self.get_el(parent, f"{xpath}[1]")
+        compiled = self._compile_if_possible(parent, f"{xpath}[@xml:lang=$lang]")
+        if isinstance(compiled, str):
+            return self.get_el(parent, f"{xpath}[@xml:lang='{lang}']")
+        found = compiled(parent, lang=lang)
+        return found[0] if found else None
+
+    def get_all_els(self, parent: T_ET.Element, xpath: XPathLike) -> list[T_ET.Element]:
         """Get all xml elements by xpath."""
+        if isinstance(xpath, str):
+            xpath = self._compile_if_possible(parent, xpath)
+        if not isinstance(xpath, str):
+            return xpath(parent)
         el = parent.findall(xpath, self.xml_ns)
         return el
+
+    def _compile_if_possible(self, parent: T_ET.Element, xpath: str) -> XPathLike:
+        """
+        Return compiled version of the path, or the path itself if it should be evaluated by `find`.
+
+        ElementPath `find` is used for paths which are not valid XPath and for elements created by other libraries.
+
+        Compiled XPath is evaluated in C and several times faster than ElementPath `find`. Compiled expressions are
+        cached per namespace map, `xml_ns` may be changed at any time and the next lookup follows the change.
+        """
+        if not isinstance(parent, _lxml_ET._Element):
+            return xpath
+        compiled = _compile_path(xpath, self.__xml_ns.key)
+        return compiled if compiled is not None else xpath